@@ -16,10 +16,14 @@ Optimizations:
 5. Lazy evaluation of alternatives
 """
 
+import collections
 import time
+from bisect import bisect_right
 from typing import List, Optional, Tuple, Dict, Any
 from functools import lru_cache
 
+import numpy as np
+
 from .types import (
     Move,
     TimelineEntry,
@@ -36,25 +40,29 @@ from .types import (
 )
 from .threat_detector import ThreatDetector
 from .position_evaluator import PositionEvaluator
+from .coordinate_utils import index_to_notation
 from .role_evaluator import RoleEvaluator, PlayerRole
 from .comment_generator import CommentGenerator, SUPPORTED_LANGUAGES
 
 
 # Pre-computed position bonuses for 15x15 board
 _POSITION_BONUS_CACHE: Dict[Tuple[int, int], float] = {}
+# Same values as a contiguous float32 grid: one C-level indexed load per
+# lookup instead of tuple allocation + dict probing in the hot loops
+_POSITION_BONUS_ARRAY: np.ndarray = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=np.float32)
 
 
 def _init_position_bonus_cache(board_size: int = BOARD_SIZE):
     """Pre-compute position bonuses for all cells."""
-    global _POSITION_BONUS_CACHE
+    global _POSITION_BONUS_CACHE, _POSITION_BONUS_ARRAY
     if _POSITION_BONUS_CACHE:
         return
-    
+
     import math
     center = (board_size - 1) / 2.0
     max_distance = math.sqrt(2 * center * center)
     max_bonus = 50.0
-    
+
     for x in range(board_size):
         for y in range(board_size):
             dx = abs(x - center)
@@ -63,11 +71,194 @@ def _init_position_bonus_cache(board_size: int = BOARD_SIZE):
             bonus = max_bonus * (1.0 - (distance / max_distance))
             _POSITION_BONUS_CACHE[(x, y)] = max(0.0, bonus)
 
+    _POSITION_BONUS_ARRAY = np.zeros((board_size, board_size), dtype=np.float32)
+    for (x, y), bonus in _POSITION_BONUS_CACHE.items():
+        _POSITION_BONUS_ARRAY[x, y] = bonus
+
 
 # Initialize cache on module load
 _init_position_bonus_cache()
 
 
+# Zobrist tables for incremental board hashing. Keys for "board + one trial
+# stone" are derived from the pre-move key with a single XOR instead of
+# rehashing the whole board on every threat-cache probe.
+_ZOBRIST_TABLE: List[List[Dict[str, int]]] = []
+_ZOBRIST_PLAYER: Dict[str, int] = {}
+
+
+def _init_zobrist(board_size: int = BOARD_SIZE):
+    """Pre-compute random bitstrings for Zobrist hashing."""
+    global _ZOBRIST_TABLE, _ZOBRIST_PLAYER
+    if _ZOBRIST_TABLE:
+        return
+
+    import random
+    rng = random.Random(0x5EED)
+    _ZOBRIST_TABLE = [
+        [{"X": rng.getrandbits(64), "O": rng.getrandbits(64)}
+         for _ in range(board_size)]
+        for _ in range(board_size)
+    ]
+    _ZOBRIST_PLAYER = {"X": rng.getrandbits(64), "O": rng.getrandbits(64)}
+
+
+_init_zobrist()
+
+
+# Quick-pattern scoring table: each direction looks at 3 cells on both sides
+# of the candidate, giving a 6-cell window packed into 12 bits (2 bits per
+# cell: 0=off-board, 1=empty, 2=own piece, 3=opponent). The per-direction
+# score for every possible window is precomputed so the hot loop does one
+# table load instead of the branchy counting logic.
+_QPS_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# Byte codes for the flat board used in summary replay (0 = empty)
+_PLAYER_CODE = {"X": 1, "O": 2}
+
+# Alternative-score normalization: score thresholds and the 0-10 display
+# value for each band (bisect_right picks the band). The array twins feed
+# np.searchsorted when a whole batch of scores is normalized at once.
+_ALT_SCORE_THRESHOLDS = (100, 1000, 5000, 10000, 50000)
+_ALT_NORM_SCORES = (5.0, 6.0, 7.0, 8.0, 9.0, 10.0)
+_ALT_THRESH_ARR = np.array(_ALT_SCORE_THRESHOLDS, dtype=np.float64)
+_ALT_NORM_ARR = np.array(_ALT_NORM_SCORES, dtype=np.float32)
+
+# Batch size from which vectorized normalization beats per-score bisect
+_ALT_BATCH_MIN = 8
+
+# Fallback notes per classification when no threat-specific note applies
+_CATEGORY_NOTES = {
+    MoveClassification.EXCELLENT: "Nước đi xuất sắc!",
+    MoveClassification.GOOD: "Nước đi tốt.",
+    MoveClassification.OKAY: "Nước đi chấp nhận được.",
+    MoveClassification.WEAK: "Có thể chơi tốt hơn.",
+    MoveClassification.BLUNDER: "Sai lầm nghiêm trọng!",
+}
+_DEFAULT_NOTE = "Nước đi bình thường."
+
+# Own-threat notes checked after the opponent-context branches, strongest
+# first (FIVE and OPEN_FOUR have dedicated branches earlier in
+# _generate_note_fast and are deliberately not listed here)
+_NOTE_RULES = (
+    (ThreatType.FOUR, "Tạo đường tứ, buộc đối thủ chặn."),
+    (ThreatType.OPEN_THREE, "Tạo ba mở, đe dọa mạnh."),
+)
+
+# Threat types reported in comments, strongest first
+_ORDERED_THREATS = (
+    ThreatType.FIVE,
+    ThreatType.OPEN_FOUR,
+    ThreatType.FOUR,
+    ThreatType.OPEN_THREE,
+    ThreatType.THREE,
+)
+
+
+def _has_five(flat_board, n: int, x: int, y: int, code: int) -> bool:
+    """Win-scan kernel: does the stone at (x, y) complete a five?
+
+    Kept as a free function with only integer locals and flat indexing so
+    it can be handed to a JIT compiler unchanged; without one it is still
+    the tightest pure-Python form of the scan.
+    """
+    for dx, dy in _QPS_DIRECTIONS:
+        count = 1
+        i = x + dx
+        j = y + dy
+        while 0 <= i < n and 0 <= j < n and flat_board[i * n + j] == code:
+            count += 1
+            i += dx
+            j += dy
+        i = x - dx
+        j = y - dy
+        while 0 <= i < n and 0 <= j < n and flat_board[i * n + j] == code:
+            count += 1
+            i -= dx
+            j -= dy
+        if count >= 5:
+            return True
+    return False
+
+# Direction-name -> (dx, dy) deltas, built once instead of per call
+_DIR_DELTA: Dict[str, Tuple[int, int]] = {
+    "horizontal": (0, 1),
+    "vertical": (1, 0),
+    "diagonal_down": (1, 1),
+    "diagonal_up": (1, -1),
+}
+
+# Classification thresholds (percentage of best score) and the labels they
+# bracket; bisect over the thresholds picks the label without branching
+_CLASS_THRESHOLDS = (30.0, 50.0, 70.0, 85.0)
+_CLASS_LABELS = (
+    MoveClassification.BLUNDER,
+    MoveClassification.WEAK,
+    MoveClassification.OKAY,
+    MoveClassification.GOOD,
+    MoveClassification.EXCELLENT,
+)
+_DIR_SCORE_TABLE: List[float] = []
+
+
+def _score_pattern_window(cells: Tuple[int, ...]) -> float:
+    """Score one packed 6-cell window (reference logic for the table)."""
+    player_count = 0
+    opponent_count = 0
+    opponent_consecutive = 0
+
+    for side in (cells[:3], cells[3:]):
+        consecutive_opponent = 0
+        for code in side:
+            if code == 2:
+                player_count += 1
+            elif code == 3:
+                opponent_count += 1
+                consecutive_opponent += 1
+            else:
+                break  # Empty cell or board edge ends the side
+        opponent_consecutive = max(opponent_consecutive, consecutive_opponent)
+
+    score = 0.0
+    # Offensive value
+    if player_count >= 4:
+        score += 5000
+    elif player_count >= 3:
+        score += 1000
+    elif player_count >= 2:
+        score += 100
+    elif player_count >= 1:
+        score += 10
+
+    # Defensive value
+    if opponent_consecutive >= 3:
+        score += 4000
+    elif opponent_count >= 3:
+        score += 2000
+    elif opponent_consecutive >= 2:
+        score += 500
+    elif opponent_count >= 2:
+        score += 200
+
+    return score
+
+
+def _init_dir_score_table():
+    """Pre-compute the per-direction score for all 4096 packed windows."""
+    global _DIR_SCORE_TABLE
+    if _DIR_SCORE_TABLE:
+        return
+
+    table = []
+    for packed in range(4096):
+        cells = tuple((packed >> (2 * (5 - i))) & 3 for i in range(6))
+        table.append(_score_pattern_window(cells))
+    _DIR_SCORE_TABLE = table
+
+
+_init_dir_score_table()
+
+
 class OptimizedBasicAnalyzer:
     """
     Optimized rule-based game analyzer for Gomoku/Caro.
@@ -90,86 +281,224 @@ class OptimizedBasicAnalyzer:
         self.role_evaluator = RoleEvaluator(board_size)
         self.comment_generator = CommentGenerator()
         
-        # Threat cache: board_hash -> ThreatResult
-        self._threat_cache: Dict[int, Any] = {}
+        # Bitboard masks for candidate generation (bit index = x*N + y).
+        # The edge masks stop horizontal shifts from wrapping across rows.
+        n = board_size
+        self._bb_full_mask = (1 << (n * n)) - 1
+        left_col = 0
+        right_col = 0
+        for x in range(n):
+            left_col |= 1 << (x * n)
+            right_col |= 1 << (x * n + n - 1)
+        self._bb_not_left = self._bb_full_mask & ~left_col
+        self._bb_not_right = self._bb_full_mask & ~right_col
+
+        # Threat cache: board_hash -> ThreatResult (LRU via OrderedDict)
+        self._threat_cache: "collections.OrderedDict[int, Any]" = collections.OrderedDict()
+        self._threat_cache_limit = 2048
         self._cache_hits = 0
         self._cache_misses = 0
-    
+
+        # Best-moves cache: (stone_hash, player, top_n) -> scored moves.
+        # Lets repeat positions (notably the final best_move probe) skip
+        # the candidate scan entirely
+        self._best_moves_cache: "collections.OrderedDict[Tuple[int, str, int], List[Tuple[int, int, float]]]" = collections.OrderedDict()
+        self._best_moves_cache_limit = 512
+
+        # Terminal verdict of the last summarized game: (winner, signature)
+        self._last_terminal: Tuple[Optional[str], Optional[Tuple]] = (None, None)
+
+        # Notation strings per cell, computed once so alternatives never
+        # pay the conversion (or its failure fallback) per move
+        self._notation: List[List[str]] = []
+        for x in range(n):
+            row_notation = []
+            for y in range(n):
+                try:
+                    row_notation.append(index_to_notation(x, y))
+                except Exception:
+                    row_notation.append(f"{chr(ord('A') + y)}{x + 1}")
+            self._notation.append(row_notation)
+
+    def _board_stone_hash(self, board: List[List[Optional[str]]]) -> int:
+        """Compute the Zobrist hash of the stones on the board."""
+        h = 0
+        for x in range(self.board_size):
+            row = board[x]
+            for y in range(self.board_size):
+                cell = row[y]
+                if cell is not None:
+                    h ^= _ZOBRIST_TABLE[x][y][cell]
+        return h
+
     def _board_hash(self, board: List[List[Optional[str]]], player: str) -> int:
         """Compute a hash for board state."""
-        # Simple hash using tuple of tuples
-        board_tuple = tuple(tuple(row) for row in board)
-        return hash((board_tuple, player))
-    
+        return self._board_stone_hash(board) ^ _ZOBRIST_PLAYER[player]
+
     def _get_threats_cached(
-        self, 
-        board: List[List[Optional[str]]], 
-        player: str
+        self,
+        board: List[List[Optional[str]]],
+        player: str,
+        board_hash: Optional[int] = None
     ) -> Any:
-        """Get threats with caching."""
-        board_hash = self._board_hash(board, player)
+        """Get threats with caching.
+
+        Callers that already know the Zobrist key (e.g. from incremental
+        updates) can pass it via board_hash to skip the full-board rehash.
+        """
+        if board_hash is None:
+            board_hash = self._board_hash(board, player)
         
-        if board_hash in self._threat_cache:
+        cached = self._threat_cache.get(board_hash)
+        if cached is not None:
             self._cache_hits += 1
-            return self._threat_cache[board_hash]
-        
+            self._threat_cache.move_to_end(board_hash)
+            return cached
+
         self._cache_misses += 1
         result = self.threat_detector.detect_all_threats(board, player)
-        
-        # Limit cache size
-        if len(self._threat_cache) > 1000:
-            # Clear oldest entries (simple approach)
-            self._threat_cache.clear()
-        
+
         self._threat_cache[board_hash] = result
+        # Evict least-recently-used entries instead of wiping the whole
+        # cache, so long games keep their hit rate
+        if len(self._threat_cache) > self._threat_cache_limit:
+            self._threat_cache.popitem(last=False)
+
         return result
-    
-    def analyze_game(self, moves: List[Move], language: str = "vi") -> AnalysisResult:
+
+    def _get_threats_after_move(
+        self,
+        board: List[List[Optional[str]]],
+        x: int,
+        y: int,
+        player: str,
+        pre_result: Any,
+        board_hash: int
+    ) -> Any:
+        """Get threats for player after a stone was just placed at (x, y).
+
+        Probes the threat cache first; on a miss, recomputes only the four
+        lines through (x, y) from pre_result instead of a full-board scan.
+        """
+        cached = self._threat_cache.get(board_hash)
+        if cached is not None:
+            self._cache_hits += 1
+            self._threat_cache.move_to_end(board_hash)
+            return cached
+
+        self._cache_misses += 1
+        result = self.threat_detector.detect_threats_delta(
+            pre_result, board, x, y, player
+        )
+
+        self._threat_cache[board_hash] = result
+        if len(self._threat_cache) > self._threat_cache_limit:
+            self._threat_cache.popitem(last=False)
+
+        return result
+
+    def _get_threats_with_move(
+        self,
+        board: List[List[Optional[str]]],
+        player: str,
+        move: Tuple[int, int]
+    ) -> Any:
+        """Get threats for player as if a stone were placed at `move`.
+
+        The caller's board is never left modified: the hypothetical
+        position is resolved through the Zobrist threat cache, and on a
+        miss the trial placement is confined to this method and undone
+        before returning.
+        """
+        x, y = move
+        if board[x][y] is not None:
+            return self._get_threats_cached(board, player)
+
+        stones_hash = self._board_stone_hash(board)
+        after_hash = (
+            stones_hash ^ _ZOBRIST_TABLE[x][y][player] ^ _ZOBRIST_PLAYER[player]
+        )
+        cached = self._threat_cache.get(after_hash)
+        if cached is not None:
+            self._cache_hits += 1
+            self._threat_cache.move_to_end(after_hash)
+            return cached
+
+        pre_result = self._get_threats_cached(
+            board, player, board_hash=stones_hash ^ _ZOBRIST_PLAYER[player]
+        )
+        board[x][y] = player
+        try:
+            return self._get_threats_after_move(
+                board, x, y, player, pre_result, after_hash
+            )
+        finally:
+            board[x][y] = None
+
+    def analyze_game(
+        self,
+        moves: List[Move],
+        language: str = "vi",
+        all_languages: bool = False
+    ) -> AnalysisResult:
         """
         Analyze a complete game move-by-move (optimized version).
-        
+
         Args:
             moves: List of moves in the game
             language: Target language for primary comments (vi, en, zh, ja)
-            
+            all_languages: Generate comments in every supported language
+                instead of only the requested one
+
         Returns:
             AnalysisResult with timeline, mistakes, patterns, and summary
         """
         if language not in SUPPORTED_LANGUAGES:
             language = "vi"
+
+        # Memo for per-move comments: many moves share the same
+        # (classification, threats, winning) context, so generation work
+        # collapses to a handful of distinct outputs per game
+        comment_memo: Dict[Tuple, Dict[str, str]] = {}
         
         start_time = time.time()
         
-        # Clear threat cache for new analysis
+        # Clear caches for new analysis
         self._threat_cache.clear()
+        self._best_moves_cache.clear()
         
-        # Initialize empty board
+        # Single incrementally-updated board: each iteration leaves its move
+        # applied, so the board entering iteration i is exactly the pre-move
+        # state (no per-move snapshot copies)
         board = [[None for _ in range(self.board_size)] for _ in range(self.board_size)]
-        
+
         timeline: List[TimelineEntry] = []
         mistakes: List[Mistake] = []
         all_best_moves: List[Tuple[int, List[Tuple[int, int, float]]]] = []
-        
-        # Pre-compute all moves on board first for faster analysis
-        boards_at_move = []
-        temp_board = [[None for _ in range(self.board_size)] for _ in range(self.board_size)]
-        for move in moves:
-            boards_at_move.append([row[:] for row in temp_board])
-            temp_board[move.x][move.y] = move.player
-        
+
+        # Threat results on the current (post-move) board, per player.
+        # Each iteration's pre-move board is the previous iteration's
+        # post-move board, so these carry over and replace the undo/redo
+        # cache probes in the mistake-detection block.
+        threats_on_board: Dict[str, Any] = {}
+
+        # Incremental Zobrist key over the stones on the board, updated
+        # with a single XOR per placement so every threat-cache probe in
+        # the loop avoids rehashing the whole board
+        stones_hash = 0
+
         # Analyze each move
         for i, move in enumerate(moves):
             move_number = i + 1
             player = move.player
             opponent = "O" if player == "X" else "X"
-            
-            # Use pre-computed board state
-            board = boards_at_move[i]
-            
+
             # Find best moves using fast heuristic (no search)
             # Only compute for every 3rd move to save time, interpolate others
             if i % 3 == 0 or i < 5 or i >= len(moves) - 3:
-                best_moves = self._find_best_moves_fast(board, player, top_n=3)
+                best_moves = self._find_best_moves_fast(
+                    board, player, top_n=3, stones_hash=stones_hash
+                )
             all_best_moves.append((move_number, best_moves))
             
             # Evaluate the actual move (simplified)
@@ -181,11 +510,31 @@ class OptimizedBasicAnalyzer:
             # Classify the move
             category = self._classify_move_fast(actual_score, best_score)
             
+            # Threats BEFORE this move, reused from the previous iteration
+            # when available (for context-aware notes and mistake detection)
+            opp_threats_before = threats_on_board.get(opponent)
+            if opp_threats_before is None:
+                opp_threats_before = self._get_threats_cached(
+                    board, opponent,
+                    board_hash=stones_hash ^ _ZOBRIST_PLAYER[opponent]
+                )
+            our_threats_before = threats_on_board.get(player)
+            if our_threats_before is None:
+                our_threats_before = self._get_threats_cached(
+                    board, player,
+                    board_hash=stones_hash ^ _ZOBRIST_PLAYER[player]
+                )
+
             # Make the move on the board for threat detection
             board[move.x][move.y] = player
-            
+            stones_hash ^= _ZOBRIST_TABLE[move.x][move.y][player]
+
             # Get threats after move
-            player_threats = self._get_threats_cached(board, player)
+            player_threats = self._get_threats_cached(
+                board, player,
+                board_hash=stones_hash ^ _ZOBRIST_PLAYER[player]
+            )
+            opp_threats_after = None
             
             # Override classification for strong moves
             if player_threats.threats.get(ThreatType.FIVE, 0) > 0:
@@ -203,19 +552,17 @@ class OptimizedBasicAnalyzer:
             
             # Early game tolerance
             if move_number <= 8 and category == MoveClassification.BLUNDER:
-                opp_threats = self._get_threats_cached(board, opponent)
+                opp_threats_after = self._get_threats_cached(
+                    board, opponent,
+                    board_hash=stones_hash ^ _ZOBRIST_PLAYER[opponent]
+                )
                 has_immediate_threat = (
-                    opp_threats.threats.get(ThreatType.FOUR, 0) > 0 or
-                    opp_threats.threats.get(ThreatType.OPEN_FOUR, 0) > 0
+                    opp_threats_after.threats.get(ThreatType.FOUR, 0) > 0 or
+                    opp_threats_after.threats.get(ThreatType.OPEN_FOUR, 0) > 0
                 )
                 if not has_immediate_threat:
                     category = MoveClassification.OKAY
-            
-            # Get opponent threats BEFORE this move (for context-aware notes)
-            board[move.x][move.y] = None  # Undo temporarily
-            opp_threats_before = self._get_threats_cached(board, opponent)
-            board[move.x][move.y] = player  # Redo
-            
+
             # Simplified score and win_prob calculation (no full position eval)
             score = player_threats.total_score
             win_prob = min(0.95, max(0.05, 0.5 + score / 20000))
@@ -230,16 +577,35 @@ class OptimizedBasicAnalyzer:
             # Generate note with opponent context
             note = self._generate_note_fast(move, category, player_threats, opp_threats_before)
             
-            # Generate multi-language comments
+            # Generate comments lazily: only the requested language unless
+            # the caller explicitly asked for all of them
             threats_created = self._extract_threat_types(player_threats)
-            multi_lang_comment = self.comment_generator.generate_all_languages(
-                classification=category,
-                threats_created=threats_created,
-                threats_blocked=[],
-                is_winning=player_threats.threats.get(ThreatType.FIVE, 0) > 0,
-                is_forced=False,
-                better_move=None
-            )
+            is_winning = player_threats.threats.get(ThreatType.FIVE, 0) > 0
+            memo_key = (category, tuple(threats_created), is_winning)
+            comments = comment_memo.get(memo_key)
+            if comments is None:
+                if all_languages:
+                    comments = self.comment_generator.generate_all_languages(
+                        classification=category,
+                        threats_created=threats_created,
+                        threats_blocked=[],
+                        is_winning=is_winning,
+                        is_forced=False,
+                        better_move=None
+                    ).to_dict()
+                else:
+                    comments = {
+                        language: self.comment_generator.generate_comment(
+                            classification=category,
+                            threats_created=threats_created,
+                            threats_blocked=[],
+                            is_winning=is_winning,
+                            is_forced=False,
+                            better_move=None,
+                            language=language
+                        )
+                    }
+                comment_memo[memo_key] = comments
             
             # Generate alternatives (simplified) - only for important moves
             alternatives = []
@@ -256,7 +622,7 @@ class OptimizedBasicAnalyzer:
                 category=category,
                 note=note,
                 role=player_role,
-                comments=multi_lang_comment.to_dict(),
+                comments=comments,
                 alternatives=alternatives
             )
             timeline.append(entry)
@@ -280,12 +646,7 @@ class OptimizedBasicAnalyzer:
                 opp_had_open_four = opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0) > 0
                 opp_had_four = opp_threats_before.threats.get(ThreatType.FOUR, 0) > 0
                 opp_had_open_three = opp_threats_before.threats.get(ThreatType.OPEN_THREE, 0) > 0
-                
-                # Check what WE had BEFORE this move (to see if we CREATED new threats)
-                board[move.x][move.y] = None  # Undo temporarily
-                our_threats_before = self._get_threats_cached(board, player)
-                board[move.x][move.y] = player  # Redo
-                
+
                 # Did this move CREATE new threats? (not just maintain existing ones)
                 created_new_four = (
                     player_threats.threats.get(ThreatType.FOUR, 0) > 
@@ -297,7 +658,11 @@ class OptimizedBasicAnalyzer:
                 )
                 
                 # Check if we blocked the threat
-                opp_threats_after = self._get_threats_cached(board, opponent)
+                if opp_threats_after is None:
+                    opp_threats_after = self._get_threats_cached(
+                        board, opponent,
+                        board_hash=stones_hash ^ _ZOBRIST_PLAYER[opponent]
+                    )
                 blocked_open_four = opp_had_open_four and opp_threats_after.threats.get(ThreatType.OPEN_FOUR, 0) == 0
                 blocked_four = opp_had_four and opp_threats_after.threats.get(ThreatType.FOUR, 0) < opp_threats_before.threats.get(ThreatType.FOUR, 0)
                 blocked_open_three = opp_had_open_three and opp_threats_after.threats.get(ThreatType.OPEN_THREE, 0) < opp_threats_before.threats.get(ThreatType.OPEN_THREE, 0)
@@ -352,12 +717,14 @@ class OptimizedBasicAnalyzer:
                     best_alternative={"x": best_alt[0], "y": best_alt[1]}
                 )
                 mistakes.append(mistake)
-        
-        # Use final board state
-        final_board = [[None for _ in range(self.board_size)] for _ in range(self.board_size)]
-        for move in moves:
-            final_board[move.x][move.y] = move.player
-        
+
+            # Roll threat results forward: this post-move board is the
+            # next iteration's pre-move board
+            threats_on_board = {player: player_threats, opponent: opp_threats_after}
+
+        # The incremental board already holds the final state
+        final_board = board
+
         # Detect patterns (simplified)
         patterns = self._detect_patterns_fast(timeline, moves)
         
@@ -366,9 +733,11 @@ class OptimizedBasicAnalyzer:
         
         # Find best move for current position
         best_move = None
-        if moves and not self._is_game_over(final_board):
+        if moves and not self._is_game_over_cached(moves, final_board, stones_hash=stones_hash):
             next_player = "O" if moves[-1].player == "X" else "X"
-            best_moves = self._find_best_moves_fast(final_board, next_player, top_n=1)
+            best_moves = self._find_best_moves_fast(
+                final_board, next_player, top_n=1, stones_hash=stones_hash
+            )
             if best_moves:
                 bm = best_moves[0]
                 best_move = BestMove(
@@ -394,11 +763,12 @@ class OptimizedBasicAnalyzer:
         self,
         board: List[List[Optional[str]]],
         player: str,
-        top_n: int = 3
+        top_n: int = 3,
+        stones_hash: Optional[int] = None
     ) -> List[Tuple[int, int, float]]:
         """
         Find best moves using fast heuristic scoring (no search).
-        
+
         Ultra-optimized version with DEFENSIVE PRIORITY:
         1. Check opponent threats FIRST - if urgent, prioritize blocking
         2. Limit candidates to 15 best positions
@@ -406,9 +776,21 @@ class OptimizedBasicAnalyzer:
         4. Only do full threat detection for top candidates
         """
         opponent = "O" if player == "X" else "X"
-        
+
+        if stones_hash is None:
+            stones_hash = self._board_stone_hash(board)
+
+        # Repeat position: the answer is already known
+        cache_key = (stones_hash, player, top_n)
+        cached = self._best_moves_cache.get(cache_key)
+        if cached is not None:
+            self._best_moves_cache.move_to_end(cache_key)
+            return list(cached)
+
         # CRITICAL: Check opponent threats BEFORE finding moves
-        opp_threats_before = self._get_threats_cached(board, opponent)
+        opp_threats_before = self._get_threats_cached(
+            board, opponent, board_hash=stones_hash ^ _ZOBRIST_PLAYER[opponent]
+        )
         opp_has_open_four = opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0) > 0
         opp_has_four = opp_threats_before.threats.get(ThreatType.FOUR, 0) > 0
         opp_has_open_three = opp_threats_before.threats.get(ThreatType.OPEN_THREE, 0) > 0
@@ -435,15 +817,15 @@ class OptimizedBasicAnalyzer:
         # Limit candidates for performance
         if len(candidates) > 20:  # Increased limit when defensive
             # Sort by position bonus and take top 20
-            candidates = sorted(candidates, 
-                key=lambda p: _POSITION_BONUS_CACHE.get(p, 0), 
+            candidates = sorted(candidates,
+                key=lambda p: _POSITION_BONUS_ARRAY[p[0], p[1]],
                 reverse=True)[:20]
-        
+
         scored_moves: List[Tuple[int, int, float]] = []
-        
+
         for x, y in candidates:
             # Quick score based on position and local pattern
-            score = _POSITION_BONUS_CACHE.get((x, y), 0)
+            score = float(_POSITION_BONUS_ARRAY[x, y])
             
             # Check immediate neighbors for quick pattern detection
             score += self._quick_pattern_score(board, x, y, player)
@@ -456,25 +838,46 @@ class OptimizedBasicAnalyzer:
         
         # Do full threat detection only for top candidates
         final_moves: List[Tuple[int, int, float]] = []
-        
-        for x, y, base_score in top_candidates:
+
+        # Our pre-move threats, fetched once: each candidate's post-move
+        # threats are then derived by rescanning only the lines through it
+        our_threats_pre = self._get_threats_cached(
+            board, player, board_hash=stones_hash ^ _ZOBRIST_PLAYER[player]
+        )
+
+        for cand_idx, (x, y, base_score) in enumerate(top_candidates):
             # Make move temporarily
             board[x][y] = player
-            
+            stones_after = stones_hash ^ _ZOBRIST_TABLE[x][y][player]
+
             # Check our threats after move
-            our_threats = self._get_threats_cached(board, player)
-            
+            our_threats = self._get_threats_after_move(
+                board, x, y, player, our_threats_pre,
+                stones_after ^ _ZOBRIST_PLAYER[player]
+            )
+
             # Check opponent threats AFTER our move (did we block?)
-            opp_threats_after = self._get_threats_cached(board, opponent)
+            opp_threats_after = self._get_threats_after_move(
+                board, x, y, opponent, opp_threats_before,
+                stones_after ^ _ZOBRIST_PLAYER[opponent]
+            )
             
             # Calculate final score
             score = base_score
-            
-            # Winning move - highest priority
+
+            # Winning move - highest priority. The flags, not the score,
+            # drive the eager exit below: composite defensive and
+            # double-threat bonuses can stack past these thresholds
+            # without the move actually winning anything
+            makes_five = False
+            makes_open_four = False
+
             if our_threats.threats.get(ThreatType.FIVE, 0) > 0:
                 score = 100000
+                makes_five = True
             elif our_threats.threats.get(ThreatType.OPEN_FOUR, 0) > 0:
                 score = 50000
+                makes_open_four = True
             else:
                 # DEFENSIVE SCORING - Check if we blocked opponent's threat
                 blocked_open_four = opp_has_open_four and opp_threats_after.threats.get(ThreatType.OPEN_FOUR, 0) == 0
@@ -507,12 +910,26 @@ class OptimizedBasicAnalyzer:
             
             # Undo move
             board[x][y] = None
-            
+
             final_moves.append((x, y, score))
-        
+
+            # Eager exit: an immediate win (or a guaranteed one when only
+            # the top move is wanted) cannot be beaten, so skip the full
+            # threat detection for the remaining candidates and pad the
+            # result from their quick scores
+            if makes_five or (top_n == 1 and makes_open_four):
+                for pad_x, pad_y, pad_base in top_candidates[cand_idx + 1:]:
+                    final_moves.append((pad_x, pad_y, pad_base))
+                break
+
         # Sort by score descending
         final_moves.sort(key=lambda m: m[2], reverse=True)
-        return final_moves[:top_n]
+        result = final_moves[:top_n]
+
+        self._best_moves_cache[cache_key] = result
+        if len(self._best_moves_cache) > self._best_moves_cache_limit:
+            self._best_moves_cache.popitem(last=False)
+        return list(result)
     
     def _find_blocking_positions(
         self,
@@ -521,30 +938,24 @@ class OptimizedBasicAnalyzer:
     ) -> List[Tuple[int, int]]:
         """Find positions that can block a threat."""
         blocking_positions = []
-        
+
         if not threat.positions:
             return blocking_positions
-        
+
         # Get direction from threat
         direction = threat.direction
-        dx, dy = {
-            "horizontal": (0, 1),
-            "vertical": (1, 0),
-            "diagonal_down": (1, 1),
-            "diagonal_up": (1, -1),
-        }.get(direction, (0, 0))
-        
+        dx, dy = _DIR_DELTA.get(direction, (0, 0))
+
         if dx == 0 and dy == 0:
             return blocking_positions
-        
-        # Sort positions to find endpoints
+
+        # Endpoints via min/max scans instead of a sort
         if direction == "diagonal_up":
-            positions = sorted(threat.positions, key=lambda p: p[0])
+            first_pos = min(threat.positions, key=lambda p: p[0])
+            last_pos = max(threat.positions, key=lambda p: p[0])
         else:
-            positions = sorted(threat.positions)
-        
-        first_pos = positions[0]
-        last_pos = positions[-1]
+            first_pos = min(threat.positions)
+            last_pos = max(threat.positions)
         
         # Check cell before first position
         before_x = first_pos[0] - dx
@@ -572,63 +983,31 @@ class OptimizedBasicAnalyzer:
         player: str
     ) -> float:
         """Quick pattern scoring based on immediate neighbors.
-        
-        IMPROVED: Higher defensive scores to prioritize blocking.
+
+        Packs the 6-cell window of each direction into a 12-bit index and
+        looks the score up in the precomputed _DIR_SCORE_TABLE, replacing
+        the per-cell counting branches with a single table load.
         """
         score = 0.0
-        opponent = "O" if player == "X" else "X"
-        
-        # Check 4 directions
-        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
-        
-        for dx, dy in directions:
-            player_count = 0
-            opponent_count = 0
-            player_consecutive = 0
-            opponent_consecutive = 0
-            
-            # Check cells in each direction (extended to 3 for better detection)
-            for sign in [-1, 1]:
-                consecutive_player = 0
-                consecutive_opponent = 0
-                for dist in [1, 2, 3]:
-                    nx = x + dx * dist * sign
-                    ny = y + dy * dist * sign
-                    if 0 <= nx < self.board_size and 0 <= ny < self.board_size:
-                        if board[nx][ny] == player:
-                            player_count += 1
-                            consecutive_player += 1
-                        elif board[nx][ny] == opponent:
-                            opponent_count += 1
-                            consecutive_opponent += 1
-                        else:
-                            break  # Empty cell breaks consecutive
+        board_size = self.board_size
+
+        for dx, dy in _QPS_DIRECTIONS:
+            packed = 0
+            for sign in (-1, 1):
+                sdx = dx * sign
+                sdy = dy * sign
+                nx, ny = x, y
+                for _ in range(3):
+                    nx += sdx
+                    ny += sdy
+                    if 0 <= nx < board_size and 0 <= ny < board_size:
+                        cell = board[nx][ny]
+                        code = 1 if cell is None else (2 if cell == player else 3)
                     else:
-                        break
-                player_consecutive = max(player_consecutive, consecutive_player)
-                opponent_consecutive = max(opponent_consecutive, consecutive_opponent)
-            
-            # Score based on pattern - OFFENSIVE
-            if player_count >= 4:
-                score += 5000  # Winning move potential
-            elif player_count >= 3:
-                score += 1000  # Potential four
-            elif player_count >= 2:
-                score += 100   # Potential three
-            elif player_count >= 1:
-                score += 10    # Extension
-            
-            # DEFENSIVE value - INCREASED SIGNIFICANTLY
-            # Blocking opponent's threats is critical
-            if opponent_consecutive >= 3:
-                score += 4000  # MUST block - opponent has 3 consecutive
-            elif opponent_count >= 3:
-                score += 2000  # Block potential four (non-consecutive)
-            elif opponent_consecutive >= 2:
-                score += 500   # Block potential three (consecutive)
-            elif opponent_count >= 2:
-                score += 200   # Block potential three
-        
+                        code = 0
+                    packed = (packed << 2) | code
+            score += _DIR_SCORE_TABLE[packed]
+
         return score
     
     def _get_candidates_fast(
@@ -636,28 +1015,47 @@ class OptimizedBasicAnalyzer:
         board: List[List[Optional[str]]],
         radius: int = 2
     ) -> List[Tuple[int, int]]:
-        """Get candidate moves (empty cells near existing pieces)."""
-        candidates = set()
-        has_pieces = False
-        
-        for x in range(self.board_size):
-            for y in range(self.board_size):
-                if board[x][y] is not None:
-                    has_pieces = True
-                    # Add empty cells within radius
-                    for dx in range(-radius, radius + 1):
-                        for dy in range(-radius, radius + 1):
-                            nx, ny = x + dx, y + dy
-                            if (0 <= nx < self.board_size and 
-                                0 <= ny < self.board_size and
-                                board[nx][ny] is None):
-                                candidates.add((nx, ny))
-        
-        if not has_pieces:
-            center = self.board_size // 2
+        """Get candidate moves (empty cells near existing pieces).
+
+        Bit-parallel version: the occupancy is packed into a single integer
+        (bit index x*N + y) and the neighborhood is grown with shifts, one
+        dilation pass per unit of radius, instead of per-cell radius loops.
+        """
+        n = self.board_size
+
+        # Pack occupancy into a single integer
+        occ = 0
+        bit = 1
+        for x in range(n):
+            row = board[x]
+            for y in range(n):
+                if row[y] is not None:
+                    occ |= bit
+                bit <<= 1
+
+        if occ == 0:
+            center = n // 2
             return [(center, center)]
-        
-        return list(candidates)
+
+        # Chebyshev dilation: horizontal spread, then vertical spread of it
+        neigh = occ
+        for _ in range(radius):
+            horiz = (
+                neigh
+                | ((neigh & self._bb_not_left) >> 1)
+                | ((neigh & self._bb_not_right) << 1)
+            )
+            neigh = (horiz | (horiz << n) | (horiz >> n)) & self._bb_full_mask
+
+        cand_bits = neigh & ~occ
+
+        candidates: List[Tuple[int, int]] = []
+        while cand_bits:
+            low = cand_bits & -cand_bits
+            idx = low.bit_length() - 1
+            candidates.append((idx // n, idx % n))
+            cand_bits ^= low
+        return candidates
     
     def _evaluate_move_fast(
         self,
@@ -684,7 +1082,7 @@ class OptimizedBasicAnalyzer:
         
         # Calculate score
         score = our_threats.total_score - opp_threats.total_score * 0.9
-        score += _POSITION_BONUS_CACHE.get((x, y), 0)
+        score += float(_POSITION_BONUS_ARRAY[x, y])
         
         return score
     
@@ -698,19 +1096,9 @@ class OptimizedBasicAnalyzer:
             if actual_score >= 0:
                 return MoveClassification.OKAY
             return MoveClassification.WEAK
-        
+
         percentage = (actual_score / best_score) * 100
-        
-        if percentage >= 85:
-            return MoveClassification.EXCELLENT
-        elif percentage >= 70:
-            return MoveClassification.GOOD
-        elif percentage >= 50:
-            return MoveClassification.OKAY
-        elif percentage >= 30:
-            return MoveClassification.WEAK
-        else:
-            return MoveClassification.BLUNDER
+        return _CLASS_LABELS[bisect_right(_CLASS_THRESHOLDS, percentage)]
     
     def _generate_note_fast(
         self,
@@ -720,24 +1108,27 @@ class OptimizedBasicAnalyzer:
         opp_threats_before: Any = None
     ) -> str:
         """Generate Vietnamese note for a move with context awareness."""
+        t = threats.threats
+
         # Check if this is a winning move
-        if threats.threats.get(ThreatType.FIVE, 0) > 0:
+        if t.get(ThreatType.FIVE, 0) > 0:
             return "Nước thắng!"
-        
+
         # Check if opponent had OPEN_FOUR before - if so, our move is likely too late
-        opp_had_open_four = opp_threats_before and opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0) > 0
-        
-        if threats.threats.get(ThreatType.OPEN_FOUR, 0) > 0:
+        opp_t = opp_threats_before.threats if opp_threats_before else None
+        opp_had_open_four = opp_t is not None and opp_t.get(ThreatType.OPEN_FOUR, 0) > 0
+
+        if t.get(ThreatType.OPEN_FOUR, 0) > 0:
             if opp_had_open_four:
                 return "Tạo tứ mở nhưng đối thủ cũng có - quá muộn!"
             return "Tạo tứ mở, đảm bảo thắng."
-        
+
         # Check if opponent had dangerous threats that we should have blocked
-        if opp_threats_before:
-            opp_open_four = opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0)
-            opp_four = opp_threats_before.threats.get(ThreatType.FOUR, 0)
-            opp_open_three = opp_threats_before.threats.get(ThreatType.OPEN_THREE, 0)
-            
+        if opp_t is not None:
+            opp_open_four = opp_t.get(ThreatType.OPEN_FOUR, 0)
+            opp_four = opp_t.get(ThreatType.FOUR, 0)
+            opp_open_three = opp_t.get(ThreatType.OPEN_THREE, 0)
+
             if opp_open_four > 0:
                 return "Đối thủ có tứ mở - đã thua!"
             if opp_four > 0:
@@ -748,28 +1139,16 @@ class OptimizedBasicAnalyzer:
                     return "Nên chặn ba mở của đối thủ."
         
         # Our threats
-        if threats.threats.get(ThreatType.FOUR, 0) > 0:
-            return "Tạo đường tứ, buộc đối thủ chặn."
-        if threats.threats.get(ThreatType.OPEN_THREE, 0) > 0:
-            return "Tạo ba mở, đe dọa mạnh."
+        for threat_type, message in _NOTE_RULES:
+            if t.get(threat_type, 0) > 0:
+                return message
         
-        notes = {
-            MoveClassification.EXCELLENT: "Nước đi xuất sắc!",
-            MoveClassification.GOOD: "Nước đi tốt.",
-            MoveClassification.OKAY: "Nước đi chấp nhận được.",
-            MoveClassification.WEAK: "Có thể chơi tốt hơn.",
-            MoveClassification.BLUNDER: "Sai lầm nghiêm trọng!",
-        }
-        return notes.get(category, "Nước đi bình thường.")
+        return _CATEGORY_NOTES.get(category, _DEFAULT_NOTE)
     
     def _extract_threat_types(self, threats: Any) -> List[ThreatType]:
         """Extract list of threat types."""
-        result = []
-        for threat_type in [ThreatType.FIVE, ThreatType.OPEN_FOUR, ThreatType.FOUR,
-                          ThreatType.OPEN_THREE, ThreatType.THREE]:
-            if threats.threats.get(threat_type, 0) > 0:
-                result.append(threat_type)
-        return result
+        t = threats.threats
+        return [tt for tt in _ORDERED_THREATS if t.get(tt, 0) > 0]
     
     def _generate_alternatives_fast(
         self,
@@ -778,33 +1157,29 @@ class OptimizedBasicAnalyzer:
         category: MoveClassification
     ) -> List[AlternativeMove]:
         """Generate alternative move suggestions (simplified)."""
-        from .coordinate_utils import index_to_notation
-        
         alternatives = []
         is_blunder = category == MoveClassification.BLUNDER
-        
+
+        # For large inputs, normalize every score in one vectorized
+        # searchsorted; for the usual handful, scalar bisect is cheaper
+        norms = None
+        if len(best_moves) >= _ALT_BATCH_MIN:
+            scores = np.fromiter(
+                (s for _, _, s in best_moves), dtype=np.float64, count=len(best_moves)
+            )
+            norms = _ALT_NORM_ARR[np.searchsorted(_ALT_THRESH_ARR, scores, side="right")]
+
         for i, (x, y, score) in enumerate(best_moves):
             if x == actual_move.x and y == actual_move.y:
                 continue
-            
-            try:
-                position = index_to_notation(x, y)
-            except:
-                position = f"{chr(ord('A') + y)}{x + 1}"
-            
+
+            position = self._notation[x][y]
+
             # Normalize score to 0-10
-            if score >= 50000:
-                norm_score = 10.0
-            elif score >= 10000:
-                norm_score = 9.0
-            elif score >= 5000:
-                norm_score = 8.0
-            elif score >= 1000:
-                norm_score = 7.0
-            elif score >= 100:
-                norm_score = 6.0
+            if norms is not None:
+                norm_score = float(norms[i])
             else:
-                norm_score = 5.0
+                norm_score = _ALT_NORM_SCORES[bisect_right(_ALT_SCORE_THRESHOLDS, score)]
             
             alt = AlternativeMove(
                 position=position,
@@ -829,19 +1204,38 @@ class OptimizedBasicAnalyzer:
     ) -> List[Pattern]:
         """Detect tactical patterns (simplified)."""
         patterns = []
-        
-        # Find critical mistakes
+
+        # Find critical mistakes; stop as soon as the cap is reached so
+        # long games do not build patterns that would be dropped anyway
         for entry in timeline:
-            if entry.category == MoveClassification.BLUNDER:
+            if entry.category is MoveClassification.BLUNDER:
                 patterns.append(Pattern(
                     label="Sai lầm",
                     explanation="Nước đi này là sai lầm nghiêm trọng.",
                     moves=[entry.move],
                     severity="critical"
                 ))
-        
-        return patterns[:5]  # Limit patterns
+                if len(patterns) == 5:
+                    break
+
+        return patterns
     
+    def _is_winning_placement(
+        self,
+        flat_board: bytearray,
+        x: int,
+        y: int,
+        code: int
+    ) -> bool:
+        """Check whether the stone just placed at (x, y) completes a five.
+
+        Only the placed stone can finish a line through itself, so walking
+        up to 4 cells each way along the 4 directions is enough — no
+        full-board threat scan needed. `flat_board` is the byte-per-cell
+        layout (index x * N + y) with `code` from _PLAYER_CODE.
+        """
+        return _has_five(flat_board, self.board_size, x, y, code)
+
     def _generate_summary_fast(
         self,
         timeline: List[TimelineEntry],
@@ -850,34 +1244,68 @@ class OptimizedBasicAnalyzer:
     ) -> Summary:
         """Generate game summary (simplified)."""
         total_moves = len(moves)
-        
-        # Determine winner
+
+        # Determine winner: only the just-placed stone can complete a five,
+        # so a local directional check replaces the full threat scan. The
+        # replay board is one byte per cell rather than N lists of objects
         winner = None
-        board = [[None for _ in range(self.board_size)] for _ in range(self.board_size)]
+        n = self.board_size
+        flat_board = bytearray(n * n)
         for move in moves:
-            board[move.x][move.y] = move.player
-            threats = self._get_threats_cached(board, move.player)
-            if threats.threats.get(ThreatType.FIVE, 0) > 0:
+            code = _PLAYER_CODE[move.player]
+            flat_board[move.x * n + move.y] = code
+            if self._is_winning_placement(flat_board, move.x, move.y, code):
                 winner = move.player
                 break
-        
-        # Calculate stats
-        x_entries = [e for e in timeline if e.player == "X"]
-        o_entries = [e for e in timeline if e.player == "O"]
-        
-        x_stats = {
-            "total_moves": len(x_entries),
-            "excellent_moves": sum(1 for e in x_entries if e.category == MoveClassification.EXCELLENT),
-            "good_moves": sum(1 for e in x_entries if e.category == MoveClassification.GOOD),
-            "mistakes": sum(1 for m in mistakes if timeline[m.move - 1].player == "X"),
-        }
-        
-        o_stats = {
-            "total_moves": len(o_entries),
-            "excellent_moves": sum(1 for e in o_entries if e.category == MoveClassification.EXCELLENT),
-            "good_moves": sum(1 for e in o_entries if e.category == MoveClassification.GOOD),
-            "mistakes": sum(1 for m in mistakes if timeline[m.move - 1].player == "O"),
+
+        # Remember the terminal verdict for this game so the caller's
+        # game-over check does not redo the scan (see _is_game_over_cached)
+        self._last_terminal = (winner, self._game_signature(moves))
+        
+        # Calculate stats in one pass over the timeline and one over the
+        # mistakes (fields mirror the full analyzer's player stats)
+        stats = {
+            player: {
+                "total_moves": 0,
+                "excellent_moves": 0,
+                "good_moves": 0,
+                "mistakes": 0,
+                "critical_mistakes": 0,
+                "avg_score": 0,
+                "accuracy": 0,
+            }
+            for player in ("X", "O")
         }
+        score_sums = {"X": 0.0, "O": 0.0}
+        player_of_move: List[str] = []
+        for e in timeline:
+            player = e.player
+            player_of_move.append(player)
+            s = stats[player]
+            s["total_moves"] += 1
+            category = e.category
+            if category is MoveClassification.EXCELLENT:
+                s["excellent_moves"] += 1
+            elif category is MoveClassification.GOOD:
+                s["good_moves"] += 1
+            score_sums[player] += e.score
+
+        for m in mistakes:
+            s = stats[player_of_move[m.move - 1]]
+            s["mistakes"] += 1
+            if m.severity == "critical":
+                s["critical_mistakes"] += 1
+
+        for p, s in stats.items():
+            n_moves = s["total_moves"]
+            if n_moves:
+                s["avg_score"] = round(score_sums[p] / n_moves, 2)
+                s["accuracy"] = round(
+                    (s["excellent_moves"] + s["good_moves"]) / n_moves * 100, 1
+                )
+
+        x_stats = stats["X"]
+        o_stats = stats["O"]
         
         key_insights = []
         if winner:
@@ -901,26 +1329,65 @@ class OptimizedBasicAnalyzer:
     ) -> str:
         """Generate reason for best move."""
         x, y, score = best_move
-        
-        board[x][y] = player
-        threats = self._get_threats_cached(board, player)
-        board[x][y] = None
-        
-        if threats.threats.get(ThreatType.FIVE, 0) > 0:
+
+        threats = self._get_threats_with_move(board, player, (x, y))
+
+        t = threats.threats
+        if t.get(ThreatType.FIVE, 0) > 0:
             return "Nước thắng ngay lập tức!"
-        if threats.threats.get(ThreatType.OPEN_FOUR, 0) > 0:
+        if t.get(ThreatType.OPEN_FOUR, 0) > 0:
             return "Tạo tứ mở, đảm bảo thắng."
-        if threats.threats.get(ThreatType.FOUR, 0) > 0:
+        if t.get(ThreatType.FOUR, 0) > 0:
             return "Tạo đường tứ, buộc đối thủ phải chặn."
-        if threats.threats.get(ThreatType.OPEN_THREE, 0) > 0:
+        if t.get(ThreatType.OPEN_THREE, 0) > 0:
             return "Tạo ba mở, tạo áp lực lớn."
-        
+
         return "Nước đi tốt nhất."
     
-    def _is_game_over(self, board: List[List[Optional[str]]]) -> bool:
+    @staticmethod
+    def _game_signature(moves: List[Move]) -> Optional[Tuple]:
+        """Cheap identity for a move list: length plus the last move."""
+        if not moves:
+            return None
+        last = moves[-1]
+        return (len(moves), last.x, last.y, last.player)
+
+    def _is_game_over_cached(
+        self,
+        moves: List[Move],
+        board: List[List[Optional[str]]],
+        stones_hash: Optional[int] = None
+    ) -> bool:
+        """Game-over check that reuses the summary's winner verdict.
+
+        Invariant: _generate_summary_fast replays `moves` and records
+        (winner, signature) in self._last_terminal. When the signature
+        matches, a found winner means the game is over, and no winner
+        means no five exists on the board — only the full-board case
+        remains, which is just a move count. Falls back to the direct
+        scan when the signature does not match.
+        """
+        winner, signature = self._last_terminal
+        if signature is not None and signature == self._game_signature(moves):
+            if winner is not None:
+                return True
+            # No five exists; a board with fewer moves than cells cannot
+            # be full either
+            if len(moves) < self.board_size * self.board_size:
+                return False
+        return self._is_game_over(board, stones_hash=stones_hash)
+
+    def _is_game_over(
+        self,
+        board: List[List[Optional[str]]],
+        stones_hash: Optional[int] = None
+    ) -> bool:
         """Check if game is over."""
         for player in ["X", "O"]:
-            threats = self._get_threats_cached(board, player)
+            board_hash = None
+            if stones_hash is not None:
+                board_hash = stones_hash ^ _ZOBRIST_PLAYER[player]
+            threats = self._get_threats_cached(board, player, board_hash=board_hash)
             if threats.threats.get(ThreatType.FIVE, 0) > 0:
                 return True
         
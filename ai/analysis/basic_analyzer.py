@@ -14,8 +14,13 @@ Task 8.8.3: Integration with Existing System
 - Integrated EndgameAnalyzer for endgame detection and solving
 """
 
+import re
 import time
+from bisect import bisect_left, insort
+from functools import lru_cache
 from typing import List, Optional, Tuple, Dict, Any
+
+import numpy as np
 from .types import (
     Move,
     TimelineEntry,
@@ -33,12 +38,14 @@ from .types import (
 from .threat_detector import ThreatDetector
 from .position_evaluator import PositionEvaluator
 from .transposition_table import (
-    TranspositionTable, EntryType, get_transposition_table
+    TranspositionTable, EntryType, ZobristHasher, get_transposition_table
 )
 from .role_evaluator import RoleEvaluator, PlayerRole
 from .comment_generator import CommentGenerator, MultiLangComment, SUPPORTED_LANGUAGES
-from .game_metadata import GameMetadata, GameMetadataHandler, GameType, CommentComplexity
-from .basic_analysis_optimized import OptimizedBasicAnalyzer
+from .game_metadata import (
+    GameMetadata, GameMetadataHandler, GameType, CommentComplexity, get_simple_term
+)
+from .basic_analysis_optimized import OptimizedBasicAnalyzer, _has_five, _PLAYER_CODE
 from .metrics_logger import AnalysisMetricsLogger
 
 # Import advanced modules for integration (Task 8.8.3)
@@ -92,6 +99,7 @@ try:
         TempoAnalysis,
         TempoStatus,
         TempoSwitchPoint,
+        TEMPO_EXPLANATIONS,
     )
     TEMPO_ANALYZER_AVAILABLE = True
 except ImportError:
@@ -151,6 +159,199 @@ NOTE_TEMPLATES_ATTACKING = [
     "Nước đi chủ động. {reason}",
 ]
 
+def _compile_note_templates(templates: List[str]) -> List[Tuple[str, str]]:
+    """Pre-split "{reason}" templates into (prefix, suffix) pairs.
+
+    Note generation then becomes plain string concatenation instead of
+    re-parsing the format string on every call.
+    """
+    return [tuple(template.split("{reason}", 1)) for template in templates]
+
+
+_NOTE_TEMPLATES_COMPILED = {
+    category: _compile_note_templates(templates)
+    for category, templates in NOTE_TEMPLATES.items()
+}
+_NOTE_TEMPLATES_DEFENSIVE_COMPILED = _compile_note_templates(NOTE_TEMPLATES_DEFENSIVE)
+_NOTE_TEMPLATES_ATTACKING_COMPILED = _compile_note_templates(NOTE_TEMPLATES_ATTACKING)
+
+# Opponent color lookup, shared by every place that flips the side
+_OPPONENT = {"X": "O", "O": "X"}
+
+# Context-aware classification tables: metadata ratings map to base
+# classes, and the loss against the best move selects a downgrade band
+# via bisect instead of an if/elif ladder
+_RATING_TO_CLASSIFICATION = {
+    "excellent": MoveClassification.EXCELLENT,
+    "good": MoveClassification.GOOD,
+    "average": MoveClassification.OKAY,
+    "poor": MoveClassification.WEAK,
+    "blunder": MoveClassification.BLUNDER,
+}
+_SCORE_DIFF_BANDS = (50, 200, 1000, 5000)
+_SCORE_DIFF_DOWNGRADES = (
+    # diff <= 50: keep the base classification
+    None,
+    # 50 < diff <= 200: small loss, downgrade one level
+    {
+        MoveClassification.EXCELLENT: MoveClassification.GOOD,
+        MoveClassification.GOOD: MoveClassification.OKAY,
+        MoveClassification.OKAY: MoveClassification.WEAK,
+    },
+    # 200 < diff <= 1000: moderate loss, downgrade two levels
+    {
+        MoveClassification.EXCELLENT: MoveClassification.OKAY,
+        MoveClassification.GOOD: MoveClassification.WEAK,
+    },
+    # 1000 < diff <= 5000: large loss is weak regardless of base
+    dict.fromkeys(MoveClassification, MoveClassification.WEAK),
+    # diff > 5000: huge loss is a blunder regardless of base
+    dict.fromkeys(MoveClassification, MoveClassification.BLUNDER),
+)
+
+# Threat groups checked for every move in analyze_game, hoisted so the
+# per-move checks iterate a prebuilt tuple instead of spelling out one
+# dict lookup per clause
+_IMMEDIATE_THREAT_TYPES = (
+    ThreatType.FOUR,
+    ThreatType.OPEN_FOUR,
+    ThreatType.FIVE,
+    ThreatType.OPEN_THREE,
+)
+_SIGNIFICANT_THREAT_TYPES = (
+    ThreatType.FOUR,
+    ThreatType.OPEN_FOUR,
+    ThreatType.OPEN_THREE,
+)
+_CREATED_THREAT_TYPES = (
+    ThreatType.FIVE,
+    ThreatType.OPEN_FOUR,
+    ThreatType.FOUR,
+    ThreatType.BROKEN_FOUR,
+    ThreatType.OPEN_THREE,
+    ThreatType.THREE,
+    ThreatType.BROKEN_THREE,
+    ThreatType.OPEN_TWO,
+)
+_BLOCKED_THREAT_TYPES = (
+    ThreatType.OPEN_FOUR,
+    ThreatType.FOUR,
+    ThreatType.BROKEN_FOUR,
+    ThreatType.OPEN_THREE,
+    ThreatType.THREE,
+    ThreatType.BROKEN_THREE,
+)
+
+# Opponent counts whose reduction qualifies a move as good defense in
+# mistake detection: dangerous single threats and the double threats
+_DEFENSE_SINGLE_THREAT_KEYS = (
+    ThreatType.OPEN_FOUR,
+    ThreatType.FOUR,
+    ThreatType.OPEN_THREE,
+)
+_DEFENSE_DOUBLE_THREAT_KEYS = (
+    DoubleThreatType.DOUBLE_FOUR,
+    DoubleThreatType.FOUR_THREE,
+    DoubleThreatType.DOUBLE_THREE,
+)
+
+
+# Enum members resolved once at import so the hot candidate loop does a
+# plain global load instead of an attribute walk per lookup
+_T_FIVE = ThreatType.FIVE
+_T_OPEN_FOUR = ThreatType.OPEN_FOUR
+_T_FOUR = ThreatType.FOUR
+_T_OPEN_THREE = ThreatType.OPEN_THREE
+_D_DOUBLE_FOUR = DoubleThreatType.DOUBLE_FOUR
+_D_FOUR_THREE = DoubleThreatType.FOUR_THREE
+_D_DOUBLE_THREE = DoubleThreatType.DOUBLE_THREE
+
+# Search bound sentinels, built once instead of a fresh POS_INF
+# construction inside every minimax call
+NEG_INF = float('-inf')
+POS_INF = float('inf')
+
+# TT entry type by bound order: index 0 = fail-low (UPPER bound),
+# 1 = exact, 2 = fail-high (LOWER bound); lets the minimax store sites
+# pick the type by arithmetic on the bound comparisons
+_ENTRY_BY_ORDER = (EntryType.UPPER, EntryType.EXACT, EntryType.LOWER)
+
+# The 3x3 neighbourhood around a stone, unrolled once at import so the
+# candidate dilation fallback iterates a tuple instead of building two
+# nested range objects per stone; (0, 0) is omitted because the stone's
+# own cell is occupied and can never become a candidate
+_NEIGHBOR_OFFSETS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1), (0, 1),
+    (1, -1), (1, 0), (1, 1),
+)
+
+# Bit index per threat direction; with only four directions a small
+# int bitmask replaces per-move set building in pattern detection
+_DIR_IDX = {
+    "horizontal": 0,
+    "vertical": 1,
+    "diagonal_down": 2,
+    "diagonal_up": 3,
+}
+
+
+def _block_counts(result) -> Tuple[int, int, int, int, int, int, int]:
+    """
+    Pack the counts the find_best_moves blocking precheck consults into a
+    fixed-position tuple (FIVE, OPEN_FOUR, FOUR, OPEN_THREE, DOUBLE_FOUR,
+    FOUR_THREE, DOUBLE_THREE), so before/after snapshots diff positionally
+    instead of re-hashing enum keys per comparison.
+    """
+    tget = result.threats.get
+    dget = result.double_threats.get
+    return (
+        tget(_T_FIVE, 0),
+        tget(_T_OPEN_FOUR, 0),
+        tget(_T_FOUR, 0),
+        tget(_T_OPEN_THREE, 0),
+        dget(_D_DOUBLE_FOUR, 0),
+        dget(_D_FOUR_THREE, 0),
+        dget(_D_DOUBLE_THREE, 0),
+    )
+
+
+# Technical terms replaced for beginner players, keyed by lowercase form;
+# case variants ("Fork", "FORK", "Tứ Mở") are folded by matching
+# case-insensitively. Compiled into one alternation, longest term first,
+# so each comment is scanned in a single pass and e.g. "活四" wins over
+# the bare "四"
+_SIMPLIFY_TERM_KEYS = {
+    "fork": "fork",
+    "đa đường": "fork",
+    "双杀": "fork",
+    "フォーク": "fork",
+    "tứ mở": "open_four",
+    "活四": "open_four",
+    "四々": "open_four",
+    "open four": "open_four",
+    "tứ kín": "closed_four",
+    "冲四": "closed_four",
+    "四": "closed_four",
+    "tam mở": "open_three",
+    "活三": "open_three",
+    "三々": "open_three",
+}
+
+_SIMPLIFY_TERM_PATTERN = re.compile(
+    "|".join(
+        re.escape(term)
+        for term in sorted(_SIMPLIFY_TERM_KEYS, key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=None)
+def _simple_term(key: str, language: str) -> str:
+    """Memoized get_simple_term - the mapping is static, so cache lookups."""
+    return get_simple_term(key, language)
+
 # Pattern labels and explanations in Vietnamese
 PATTERN_INFO = {
     "tu_huong": {
@@ -230,6 +431,13 @@ class BasicAnalyzer:
         self.board_size = board_size
         self.threat_detector = ThreatDetector(board_size)
         self.position_evaluator = PositionEvaluator(self.threat_detector, board_size)
+        # position_bonus is a pure function of the square, so tabulate it
+        # once; move ordering reads the table instead of re-deriving the
+        # centre-distance arithmetic per candidate
+        self._pos_bonus = [
+            [self.position_evaluator.position_bonus(x, y) for y in range(board_size)]
+            for x in range(board_size)
+        ]
         self.use_tt = use_tt
         self._tt = get_transposition_table() if use_tt else None
         self.fast_mode = fast_mode
@@ -243,52 +451,158 @@ class BasicAnalyzer:
         # Requirements: 4.1 - Generate comments in 4 languages (vi, en, zh, ja)
         self.comment_generator = CommentGenerator()
         
-        # Move ordering heuristics
-        self._killer_moves: Dict[int, List[Tuple[int, int]]] = {}  # depth -> [killer1, killer2]
-        self._history_table: Dict[Tuple[int, int], int] = {}  # (x, y) -> score
+        # Move ordering heuristics, kept as flat arrays indexed by depth
+        # and board coordinates instead of tuple-keyed dicts
         self._max_killers = 2  # Keep 2 killer moves per depth
-        
-        # Initialize advanced modules (Task 8.8.3)
+        self._max_killer_depth = 16
+        self._killer_moves = np.full(
+            (self._max_killer_depth, self._max_killers, 2), -1, dtype=np.int8
+        )  # [depth, slot] -> (x, y), -1 when empty
+        self._history_table = np.zeros(
+            (board_size, board_size), dtype=np.int32
+        )  # [x, y] -> score
+
+        # Threat-result memo keyed by (Zobrist stone hash, color): the
+        # analyze_game loop revisits the same positions many times, and
+        # consecutive moves share almost all board state
+        self._zobrist = ZobristHasher(board_size)
+        self._threat_result_cache: Dict[Tuple[int, str], Any] = {}
+        self._threat_result_cache_limit = 4096
+        # Same keying for VCF results; much smaller because only the
+        # clean-position searches in the missed-win and best-move checks
+        # go through it
+        self._vcf_result_cache: Dict[Tuple[int, str], Any] = {}
+        # Evaluation memos with the same keying, fronting AnalysisCache:
+        # its keys are md5 digests of the whole board string, so a plain
+        # dict on the Zobrist hash answers repeat lookups far cheaper
+        self._eval_result_cache: Dict[Tuple[int, str], Any] = {}
+        self._move_eval_cache: Dict[Tuple[int, int, int, str], float] = {}
+        self._eval_cache_limit = 4096
+        # Completed root searches keyed by (stone hash, player, depth);
+        # the alternatives generator re-queries positions the analysis
+        # loop just searched, varying only how many moves it keeps
+        self._best_moves_cache: Dict[
+            Tuple[int, str, int], List[Tuple[int, int, float]]
+        ] = {}
+        self._best_moves_cache_limit = 512
+
+        # Opening identification keyed by the first moves; the book is
+        # static, so entries stay valid across analyses
+        self._opening_memo: Dict[tuple, Optional[Dict[str, Any]]] = {}
+        self._opening_memo_limit = 512
+
+        # Row template for empty-board construction: slicing a pre-sized
+        # row is cheaper than building each row element by element
+        self._empty_row: List[Optional[str]] = [None] * board_size
+
+        # Occupied-neighbour counts maintained alongside _search_stones:
+        # a cell with count > 0 sits next to at least one stone, so
+        # candidate generation reads this instead of dilating every stone
+        # at every node
+        self._neighbor_counts = np.zeros((board_size, board_size), dtype=np.int16)
+
+        # Occupied cells of the position being searched, kept row-major
+        # sorted and updated on make/unmake so candidate generation does
+        # not re-sweep the whole board at every node
+        self._search_stones: List[Tuple[int, int]] = []
+
+        # Whether the position handed to find_best_moves already holds a
+        # five; set once per search so per-node terminal tests only have
+        # to look at the last search move
+        self._root_has_five = False
+
+        # Five-completing candidates spotted by the latest move-ordering
+        # pass; minimax short-circuits those children to a terminal eval
+        self._ordering_five_moves: set = set()
+        
+        # Advanced modules (Task 8.8.3), DefensivePatternRecognizer
+        # (Task 32), TempoAnalyzer (Task 34) and AnalysisCache (Task 35)
+        # are constructed lazily by the properties below: fast-mode
+        # analyzers never touch most of them, so instances are only
+        # built on first use
         self.use_advanced = (not fast_mode) and use_advanced and ADVANCED_MODULES_AVAILABLE
-        if self.use_advanced:
-            self._vcf_searcher = VCFSearch(board_size, max_depth=20)
-            self._vct_searcher = VCTSearch(board_size, max_depth=16)
-            self._advanced_evaluator = AdvancedEvaluator(
-                self.threat_detector, self.position_evaluator, board_size
+        self.__vcf_searcher = None
+        self.__vct_searcher = None
+        self.__advanced_evaluator = None
+        self.__opening_book = None
+        self.__endgame_analyzer = None
+        self.__defensive_recognizer = None
+        self.__tempo_analyzer = None
+        self.__cache = None
+
+    @property
+    def _vcf_searcher(self):
+        """VCF searcher, built on first use when advanced modules are on."""
+        if not self.use_advanced:
+            return None
+        if self.__vcf_searcher is None:
+            self.__vcf_searcher = VCFSearch(self.board_size, max_depth=20)
+        return self.__vcf_searcher
+
+    @property
+    def _vct_searcher(self):
+        """VCT searcher, built on first use when advanced modules are on."""
+        if not self.use_advanced:
+            return None
+        if self.__vct_searcher is None:
+            self.__vct_searcher = VCTSearch(self.board_size, max_depth=16)
+        return self.__vct_searcher
+
+    @property
+    def _advanced_evaluator(self):
+        """Advanced evaluator, built on first use when advanced modules are on."""
+        if not self.use_advanced:
+            return None
+        if self.__advanced_evaluator is None:
+            self.__advanced_evaluator = AdvancedEvaluator(
+                self.threat_detector, self.position_evaluator, self.board_size
             )
-            self._opening_book = OpeningBook()
-            self._endgame_analyzer = EndgameAnalyzer(board_size)
-        else:
-            self._vcf_searcher = None
-            self._vct_searcher = None
-            self._advanced_evaluator = None
-            self._opening_book = None
-            self._endgame_analyzer = None
-        
-        # Initialize DefensivePatternRecognizer (Task 32 - GAP 12)
-        # Requirements: 17.1, 17.2, 17.3, 17.4
-        if DEFENSIVE_PATTERNS_AVAILABLE:
-            self._defensive_recognizer = DefensivePatternRecognizer(board_size)
-        else:
-            self._defensive_recognizer = None
-        
-        # Initialize TempoAnalyzer (Task 34 - GAP 16)
-        # Requirements: 19.1, 19.2, 19.3, 19.4
-        if TEMPO_ANALYZER_AVAILABLE:
-            self._tempo_analyzer = TempoAnalyzer(board_size)
-        else:
-            self._tempo_analyzer = None
-        
-        # Initialize AnalysisCache (Task 35 - GAP 20)
-        # Requirements: 20.1, 20.2, 20.3, 20.4
-        # - 20.1: Return cached result within 10ms
-        # - 20.2: Pattern cache with TTL=600s
-        # - 20.3: Pre-loaded comment templates
-        # - 20.4: 5x-10x performance improvement
-        if ANALYSIS_CACHE_AVAILABLE:
-            self._cache = get_analysis_cache()
-        else:
-            self._cache = None
+        return self.__advanced_evaluator
+
+    @property
+    def _opening_book(self):
+        """Opening book, built on first use when advanced modules are on."""
+        if not self.use_advanced:
+            return None
+        if self.__opening_book is None:
+            self.__opening_book = OpeningBook()
+        return self.__opening_book
+
+    @property
+    def _endgame_analyzer(self):
+        """Endgame analyzer, built on first use when advanced modules are on."""
+        if not self.use_advanced:
+            return None
+        if self.__endgame_analyzer is None:
+            self.__endgame_analyzer = EndgameAnalyzer(self.board_size)
+        return self.__endgame_analyzer
+
+    @property
+    def _defensive_recognizer(self):
+        """Defensive pattern recognizer, built on first use (Task 32 - GAP 12)."""
+        if not DEFENSIVE_PATTERNS_AVAILABLE:
+            return None
+        if self.__defensive_recognizer is None:
+            self.__defensive_recognizer = DefensivePatternRecognizer(self.board_size)
+        return self.__defensive_recognizer
+
+    @property
+    def _tempo_analyzer(self):
+        """Tempo analyzer, built on first use (Task 34 - GAP 16)."""
+        if not TEMPO_ANALYZER_AVAILABLE:
+            return None
+        if self.__tempo_analyzer is None:
+            self.__tempo_analyzer = TempoAnalyzer(self.board_size)
+        return self.__tempo_analyzer
+
+    @property
+    def _cache(self):
+        """Analysis cache, resolved on first use (Task 35 - GAP 20)."""
+        if not ANALYSIS_CACHE_AVAILABLE:
+            return None
+        if self.__cache is None:
+            self.__cache = get_analysis_cache()
+        return self.__cache
     
     def analyze_game(
         self, 
@@ -338,13 +652,32 @@ class BasicAnalyzer:
         # Initialize metadata handler (Task 28.3)
         # Requirements: 14.1 - Support game_type, rule_variant, time_control, player_elo
         self._metadata_handler = GameMetadataHandler(metadata)
-        
+        # Strictness is a constant linear factor for the whole game, so
+        # the per-move adjustments below are plain multiplies
+        strictness = self._metadata_handler.strictness_multiplier
+
         # Initialize empty board
-        board = [[None for _ in range(self.board_size)] for _ in range(self.board_size)]
-        
-        timeline: List[TimelineEntry] = []
+        board = [self._empty_row[:] for _ in range(self.board_size)]
+
+        # Threat, VCF and evaluation results in the loop below are
+        # memoized by Zobrist hash
+        self._threat_result_cache.clear()
+        self._vcf_result_cache.clear()
+        self._eval_result_cache.clear()
+        self._move_eval_cache.clear()
+        self._best_moves_cache.clear()
+
+        # Timeline and best-move slots are preallocated since each loop
+        # iteration fills exactly one; mistakes stay append-only because
+        # their count is not known up front
+        timeline: List[TimelineEntry] = [None] * len(moves)
         mistakes: List[Mistake] = []
-        all_best_moves: List[Tuple[int, List[Tuple[int, int, float]]]] = []
+        all_best_moves: List[Tuple[int, List[Tuple[int, int, float]]]] = [None] * len(moves)
+
+        # Carried from the previous iteration instead of re-reading the
+        # last timeline entry each move
+        prev_score = 0.0
+        prev_initiative = "neutral"
         
         # Opening analysis (Task 8.8.3)
         opening_info = None
@@ -366,18 +699,69 @@ class BasicAnalyzer:
             # Use deeper search in endgame, shallow in opening/midgame
             search_depth = 2 if is_endgame else 1
             best_moves = self.find_best_moves(board, player, depth=search_depth, top_n=3)
-            all_best_moves.append((move_number, best_moves))
-            
-            # Check for missed VCF/VCT (Task 8.8.3)
+            all_best_moves[i] = (move_number, best_moves)
+            
+            # Cheap tactical precheck before the deep searches: VCF can only
+            # find a win (and a block can only be missed) when one side
+            # already has a four or an open three on the board. Most moves
+            # in a game have neither, so the expensive calls below are
+            # skipped for them
+            opponent = _OPPONENT[player]
+            pre_hash = self._zobrist.compute_hash(board, 'X')
+            pre_player_threats = self._detect_threats_hashed(board, player, pre_hash)
+            pre_opp_threats = self._detect_threats_hashed(board, opponent, pre_hash)
+            pre_pt = pre_player_threats.threats
+            pre_ot = pre_opp_threats.threats
+            has_tactical_signal = any(
+                pre_pt.get(t, 0) > 0 or pre_ot.get(t, 0) > 0
+                for t in _IMMEDIATE_THREAT_TYPES
+            )
+
+            # Decisive-move short-circuit: if this move completes a five or
+            # an open four, the outcome is settled without deep evaluation.
+            # The placement is checked with a delta rescan of the four
+            # lines through the move, then the cell is restored
+            pre_occupant = board[move.x][move.y]
+            decisive_hash = pre_hash ^ self._zobrist.get_hash_key(move.x, move.y, player)
+            if pre_occupant is not None:
+                decisive_hash ^= self._zobrist.get_hash_key(move.x, move.y, pre_occupant)
+            board[move.x][move.y] = player
+            try:
+                post_player_threats = self._detect_threats_hashed(
+                    board, player, decisive_hash,
+                    pre_result=pre_player_threats, delta_move=(move.x, move.y)
+                )
+            finally:
+                board[move.x][move.y] = pre_occupant
+            post_pt = post_player_threats.threats
+            is_decisive = (
+                post_pt.get(ThreatType.FIVE, 0) > 0 or
+                post_pt.get(ThreatType.OPEN_FOUR, 0) > 0
+            )
+
+            # Check for missed VCF/VCT (Task 8.8.3). A decisive move can
+            # never be a missed win (_check_missed_win returns None for
+            # moves creating FIVE/OPEN_FOUR), so skip the search outright
             missed_win = None
-            if self.use_advanced and self._vcf_searcher:
+            if (self.use_advanced and self._vcf_searcher
+                    and has_tactical_signal and not is_decisive):
                 missed_win = self._check_missed_win(board, player, move)
-            
-            # Evaluate the actual move using advanced evaluator if available
-            if self.use_advanced and self._advanced_evaluator:
-                actual_score = self._advanced_evaluator.evaluate_position(
-                    self._board_with_move(board, move.x, move.y, player), player
-                ).score
+
+            # Evaluate the actual move using advanced evaluator if available,
+            # falling back to the cheap evaluator on quiet positions and on
+            # decisive moves, whose category is already known
+            if (self.use_advanced and self._advanced_evaluator
+                    and has_tactical_signal and not is_decisive):
+                # Place the stone in place for the evaluation instead of
+                # copying all rows; evaluate_position only reads the board
+                prev_cell = board[move.x][move.y]
+                board[move.x][move.y] = player
+                try:
+                    actual_score = self._advanced_evaluator.evaluate_position(
+                        board, player
+                    ).score
+                finally:
+                    board[move.x][move.y] = prev_cell
             else:
                 actual_score = self.position_evaluator.evaluate_move(
                     board, move.x, move.y, player
@@ -393,49 +777,91 @@ class BasicAnalyzer:
             
             # Apply strictness multiplier based on game context (Task 28.3)
             # Requirements: 14.2, 14.3 - Tournament stricter, casual more lenient
-            actual_score = self._metadata_handler.adjust_score(actual_score)
-            
-            # Get best move score for comparison
-            best_score = best_moves[0][2] if best_moves else 0
-            # Also adjust best_score for fair comparison
-            best_score = self._metadata_handler.adjust_score(best_score)
+            actual_score = actual_score * strictness
+
+            # Get best move score for comparison, adjusted the same way
+            best_score = (best_moves[0][2] if best_moves else 0) * strictness
             
             # Classify the move using context-aware thresholds (Task 28.3)
             # Requirements: 14.2 - Tournament games have stricter thresholds
-            category = self._classify_move_with_context(actual_score, best_score)
+            if is_decisive:
+                # Completing a five or open four is the best available play
+                # regardless of the score comparison
+                category = MoveClassification.EXCELLENT
+            else:
+                category = self._classify_move_with_context(actual_score, best_score)
             
             # WINNING MOVE OVERRIDE: If move creates OPEN_FOUR or FIVE, it's at least GOOD
             # Even if there was a "better" move, creating a winning threat is excellent play
-            player_threats_after = self.threat_detector.detect_all_threats(board, player)
-            # Note: board already has the move applied at this point
-            temp_board = [row[:] for row in board]
-            temp_board[move.x][move.y] = player
-            player_threats_with_move = self.threat_detector.detect_all_threats(temp_board, player)
+            # Zobrist hashes of the board as it is right now, without the
+            # move, and with the move placed. The hash is recomputed from
+            # the board each iteration (rather than maintained
+            # incrementally) because the missed-win search above mutates
+            # the shared board and may leave stones behind; the hash has
+            # to describe the board the detectors actually see.
+            # Passing 'X' as side-to-move keeps the hash stones-only.
+            hash_now = self._zobrist.compute_hash(board, 'X')
+            occupant = board[move.x][move.y]
+            hash_before_move = hash_now
+            if occupant is not None:
+                hash_before_move ^= self._zobrist.get_hash_key(
+                    move.x, move.y, occupant
+                )
+            hash_after_move = hash_before_move ^ self._zobrist.get_hash_key(
+                move.x, move.y, player
+            )
+
+            # Threats for both colors on the current board; these also seed
+            # the delta rescans below, which only re-examine the four lines
+            # through the placed stone instead of the whole board
+            opp_threats = self._detect_threats_hashed(board, opponent, hash_now)
+            player_threats = self._detect_threats_hashed(board, player, hash_now)
+
+            # Snapshot the pre-move position before placing the stone; every
+            # later "undo the move temporarily" consumer reuses this instead
+            # of re-cloning the board and clearing the cell. The move cell is
+            # cleared explicitly because earlier checks (missed-win search)
+            # may have already written this move onto the board
+            board_before = [row[:] for row in board]
+            board_before[move.x][move.y] = None
+
+            # Opponent threats on the pre-move position, computed once and
+            # shared by the blocked-threat, must-block and defense branches
+            opp_threats_before = self._detect_threats_hashed(
+                board_before, opponent, hash_before_move
+            )
+
+            # Make the move on the board. Placing it here (rather than after
+            # the classification adjustments below) lets the winning-move
+            # override read the real post-move board instead of a throwaway
+            # clone with the same stone
+            board[move.x][move.y] = player
+
+            player_threats_with_move = self._detect_threats_hashed(
+                board, player, hash_after_move,
+                pre_result=player_threats, delta_move=(move.x, move.y)
+            )
             if (player_threats_with_move.threats.get(ThreatType.FIVE, 0) > 0 or
                 player_threats_with_move.threats.get(ThreatType.OPEN_FOUR, 0) > 0):
                 # This is a winning move - at minimum GOOD, likely EXCELLENT
                 if category in [MoveClassification.BLUNDER, MoveClassification.WEAK, MoveClassification.OKAY]:
                     category = MoveClassification.GOOD
-            
+
             # EARLY GAME TOLERANCE: First 5 moves are more flexible
             # In opening, most center moves are roughly equivalent
-            opponent = "O" if player == "X" else "X"
-            opp_threats = self.threat_detector.detect_all_threats(board, opponent)
-            player_threats = self.threat_detector.detect_all_threats(board, player)
-            
-            # Check for immediate threats that require action
-            has_immediate_threat = (
-                opp_threats.threats.get(ThreatType.FOUR, 0) > 0 or
-                opp_threats.threats.get(ThreatType.OPEN_FOUR, 0) > 0 or
-                opp_threats.threats.get(ThreatType.FIVE, 0) > 0 or
-                opp_threats.threats.get(ThreatType.OPEN_THREE, 0) > 0
-            )
             
+            # Check for immediate threats that require action; the counts
+            # dict is bound once and the threat groups come from module
+            # tuples instead of repeating dict lookups per clause
+            opp_counts = opp_threats.threats
+            has_immediate_threat = any(
+                opp_counts.get(t, 0) > 0 for t in _IMMEDIATE_THREAT_TYPES
+            )
+
             # Check if player has significant threats (OPEN_THREE or better)
-            has_significant_player_threat = (
-                player_threats.threats.get(ThreatType.FOUR, 0) > 0 or
-                player_threats.threats.get(ThreatType.OPEN_FOUR, 0) > 0 or
-                player_threats.threats.get(ThreatType.OPEN_THREE, 0) > 0
+            player_counts = player_threats.threats
+            has_significant_player_threat = any(
+                player_counts.get(t, 0) > 0 for t in _SIGNIFICANT_THREAT_TYPES
             )
             
             # EARLY GAME: First 8 moves are more flexible (opening phase)
@@ -451,11 +877,10 @@ class BasicAnalyzer:
                     # Early game without special threat - cap at GOOD
                     category = MoveClassification.GOOD
             
-            # Make the move on the board
-            board[move.x][move.y] = player
-            
-            # Evaluate position after move using advanced evaluator if available
-            if self.use_advanced and self._advanced_evaluator:
+            # Evaluate position after move using advanced evaluator if
+            # available; decisive moves take the cheap evaluator since the
+            # verdict is already settled
+            if self.use_advanced and self._advanced_evaluator and not is_decisive:
                 eval_result = self._advanced_evaluator.evaluate_position(board, player)
             else:
                 eval_result = self.position_evaluator.evaluate_position(board, player)
@@ -475,23 +900,14 @@ class BasicAnalyzer:
             
             # Generate multi-language comments (Task 6.3)
             # Requirements: 4.1 - Generate comments in 4 languages (vi, en, zh, ja)
-            threats_created = self._extract_threat_types(eval_result.threats, player)
-            
-            # Get opponent threats before this move to detect blocked threats
-            opponent = "O" if player == "X" else "X"
-            board_before = [row[:] for row in board]
-            board_before[move.x][move.y] = None  # Undo move temporarily
-            opp_threats_before = self.threat_detector.detect_all_threats(board_before, opponent)
-            opp_threats_after = self.threat_detector.detect_all_threats(board, opponent)
-            threats_blocked = self._detect_blocked_threats(opp_threats_before, opp_threats_after)
-            
-            # Determine if this is a winning move
-            is_winning = eval_result.threats.threats.get(ThreatType.FIVE, 0) > 0
-            
-            # Determine if this was a forced response
-            is_forced = (
-                opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0) > 0 or
-                opp_threats_before.threats.get(ThreatType.FOUR, 0) > 0
+            # Opponent threats after this move, compared against the hoisted
+            # pre-move result to detect blocked threats
+            opp_threats_after = self._detect_threats_hashed(
+                board, opponent, hash_after_move,
+                pre_result=opp_threats_before, delta_move=(move.x, move.y)
+            )
+            threats_created, threats_blocked, is_winning, is_forced = self._diff_threats(
+                eval_result.threats, opp_threats_before, opp_threats_after
             )
             
             # Get better move notation if this is a blunder
@@ -544,8 +960,8 @@ class BasicAnalyzer:
             
             # Calculate board evaluation before and after move (Task 9.1)
             # Requirements: 6.1, 6.2, 6.4 - Timeline with evaluation changes
-            # Get score before this move (from previous timeline entry or 0 for first move)
-            score_before = timeline[-1].score if timeline else 0.0
+            # Get score before this move (carried from the previous entry, 0 for first move)
+            score_before = prev_score
             score_after = eval_result.score
             score_change = score_after - score_before
             
@@ -563,13 +979,21 @@ class BasicAnalyzer:
             tempo_is_switch = False
             tempo_explanation_dict = None
             
-            if self._tempo_analyzer is not None:
-                # Get previous initiative holder
-                prev_initiative = "neutral"
-                if timeline:
-                    prev_initiative = timeline[-1].initiative_holder
-                
-                # Analyze tempo for this move
+            # Quiet moves (nothing created, nothing blocked, no win, no
+            # significant score swing) cannot shift tempo, so the analyzer
+            # is only consulted when the move changed the threat picture
+            is_quiet_move = (
+                not threats_created and not threats_blocked
+                and not is_winning and not is_significant
+            )
+            if is_quiet_move and self._tempo_analyzer is not None:
+                # Synthesize the analyzer's quiet-move verdict directly
+                tempo_initiative = prev_initiative
+                tempo_explanation_dict = dict(TEMPO_EXPLANATIONS["slow_no_threat"])
+
+            if self._tempo_analyzer is not None and not is_quiet_move:
+                # Analyze tempo for this move; prev_initiative carries the
+                # previous entry's initiative holder
                 tempo_result = self._tempo_analyzer.analyze_tempo(
                     board_before,  # Board state before this move
                     board,  # Board state after this move
@@ -612,22 +1036,27 @@ class BasicAnalyzer:
                 is_tempo_switch=tempo_is_switch,
                 tempo_explanation=tempo_explanation_dict
             )
-            timeline.append(entry)
-            
+            timeline[i] = entry
+            prev_score = score_after
+            prev_initiative = tempo_initiative
+
             # Check for mistakes (enhanced with missed win detection)
             # FIXED: Skip mistake detection if this move wins the game
             # FIVE = already won, OPEN_FOUR = guaranteed win next move
             # BUT: If opponent had OPEN_FOUR before our move, we MUST block!
-            player_has_five = eval_result.threats.threats.get(ThreatType.FIVE, 0) > 0
-            player_has_open_four = eval_result.threats.threats.get(ThreatType.OPEN_FOUR, 0) > 0
-            
+            eval_counts = eval_result.threats.threats
+            player_has_five = eval_counts.get(ThreatType.FIVE, 0) > 0
+            player_has_open_four = eval_counts.get(ThreatType.OPEN_FOUR, 0) > 0
+
             # Check if opponent had OPEN_FOUR before this move (must block!)
-            opponent = "O" if player == "X" else "X"
-            board_before_move = [row[:] for row in board]
-            board_before_move[move.x][move.y] = None  # Undo the move temporarily
-            opp_threats_before_move = self.threat_detector.detect_all_threats(board_before_move, opponent)
-            opp_had_open_four = opp_threats_before_move.threats.get(ThreatType.OPEN_FOUR, 0) > 0
-            opp_had_four = opp_threats_before_move.threats.get(ThreatType.FOUR, 0) > 0
+            # The before/after results are the ones hoisted to the top of
+            # the loop; bind their count dicts once for the checks below
+            ot_before = opp_threats_before.threats
+            ot_after = opp_threats_after.threats
+            dt_before = opp_threats_before.double_threats
+            dt_after = opp_threats_after.double_threats
+            opp_had_open_four = ot_before.get(ThreatType.OPEN_FOUR, 0) > 0
+            opp_had_four = ot_before.get(ThreatType.FOUR, 0) > 0
             
             # Only consider winning if we actually win (FIVE) or opponent doesn't have immediate win
             is_winning_move = player_has_five or (player_has_open_four and not opp_had_open_four and not opp_had_four)
@@ -636,60 +1065,19 @@ class BasicAnalyzer:
             # Now includes: OPEN_FOUR, OPEN_THREE, DOUBLE_THREE, FOUR_THREE, DOUBLE_FOUR
             is_good_defense = False
             if not is_winning_move:
-                opponent = "O" if player == "X" else "X"
-                # Get opponent threats BEFORE this move (board state before applying move)
-                board_before_move = [row[:] for row in board]
-                board_before_move[move.x][move.y] = None  # Undo the move temporarily
-                opp_threats_before = self.threat_detector.detect_all_threats(board_before_move, opponent)
-                
-                # Check for dangerous threats that need blocking
-                opp_open_four_before = opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0)
-                opp_four_before = opp_threats_before.threats.get(ThreatType.FOUR, 0)
-                opp_open_three_before = opp_threats_before.threats.get(ThreatType.OPEN_THREE, 0)
-                
-                # Check for double threats (very dangerous!)
-                opp_double_four_before = opp_threats_before.double_threats.get(DoubleThreatType.DOUBLE_FOUR, 0)
-                opp_four_three_before = opp_threats_before.double_threats.get(DoubleThreatType.FOUR_THREE, 0)
-                opp_double_three_before = opp_threats_before.double_threats.get(DoubleThreatType.DOUBLE_THREE, 0)
-                
-                # Get threats after our move
-                opp_threats_after = self.threat_detector.detect_all_threats(board, opponent)
-                
-                # Check if we blocked OPEN_FOUR (critical)
-                if opp_open_four_before > 0:
-                    opp_open_four_after = opp_threats_after.threats.get(ThreatType.OPEN_FOUR, 0)
-                    if opp_open_four_after < opp_open_four_before:
-                        is_good_defense = True
-                
-                # Check if we blocked FOUR (important)
-                if not is_good_defense and opp_four_before > 0:
-                    opp_four_after = opp_threats_after.threats.get(ThreatType.FOUR, 0)
-                    if opp_four_after < opp_four_before:
-                        is_good_defense = True
-                
-                # Check if we blocked OPEN_THREE (good defense)
-                if not is_good_defense and opp_open_three_before > 0:
-                    opp_open_three_after = opp_threats_after.threats.get(ThreatType.OPEN_THREE, 0)
-                    if opp_open_three_after < opp_open_three_before:
-                        is_good_defense = True
-                
-                # Check if we blocked DOUBLE_FOUR (critical - guaranteed win for opponent)
-                if not is_good_defense and opp_double_four_before > 0:
-                    opp_double_four_after = opp_threats_after.double_threats.get(DoubleThreatType.DOUBLE_FOUR, 0)
-                    if opp_double_four_after < opp_double_four_before:
-                        is_good_defense = True
-                
-                # Check if we blocked FOUR_THREE (critical - guaranteed win for opponent)
-                if not is_good_defense and opp_four_three_before > 0:
-                    opp_four_three_after = opp_threats_after.double_threats.get(DoubleThreatType.FOUR_THREE, 0)
-                    if opp_four_three_after < opp_four_three_before:
-                        is_good_defense = True
-                
-                # Check if we blocked DOUBLE_THREE (very dangerous)
-                if not is_good_defense and opp_double_three_before > 0:
-                    opp_double_three_after = opp_threats_after.double_threats.get(DoubleThreatType.DOUBLE_THREE, 0)
-                    if opp_double_three_after < opp_double_three_before:
-                        is_good_defense = True
+                # A move counts as good defense when it reduced any of the
+                # dangerous opponent counts: OPEN_FOUR/FOUR/OPEN_THREE or
+                # the double threats. Diffing the counts over fixed key
+                # tuples replaces the former six branch blocks (a drop in
+                # any count implies it was nonzero before, so the separate
+                # before > 0 guards are redundant)
+                is_good_defense = any(
+                    ot_after.get(t, 0) < ot_before.get(t, 0)
+                    for t in _DEFENSE_SINGLE_THREAT_KEYS
+                ) or any(
+                    dt_after.get(t, 0) < dt_before.get(t, 0)
+                    for t in _DEFENSE_DOUBLE_THREAT_KEYS
+                )
             
             severity = None
             if not is_winning_move and not is_good_defense:
@@ -747,11 +1135,15 @@ class BasicAnalyzer:
         # Find best move for current position (if game not finished)
         best_move = None
         if moves and not self._is_game_over(board):
-            next_player = "O" if moves[-1].player == "X" else "X"
+            next_player = _OPPONENT[moves[-1].player]
             
             # Use VCF search first for winning moves (Task 8.8.3)
             if self.use_advanced and self._vcf_searcher:
-                vcf_result = self._vcf_searcher.search(board, next_player)
+                # The missed-win check for the last move usually searched
+                # this exact position already; the memo returns it
+                vcf_result = self._search_vcf_hashed(
+                    board, next_player, self._zobrist.compute_hash(board, 'X')
+                )
                 if vcf_result.found and vcf_result.sequence:
                     first_move = vcf_result.sequence[0]
                     best_move = BestMove(
@@ -804,11 +1196,15 @@ class BasicAnalyzer:
         
         try:
             # Convert moves to format expected by opening book
-            opening_moves = [(m.x, m.y, m.player) for m in moves[:5]]
-            opening = self._opening_book.identify_opening(opening_moves)
-            
+            opening_moves = tuple((m.x, m.y, m.player) for m in moves[:5])
+            if opening_moves in self._opening_memo:
+                return self._opening_memo[opening_moves]
+
+            opening = self._opening_book.identify_opening(list(opening_moves))
+
+            info = None
             if opening:
-                return {
+                info = {
                     'name': opening.name,
                     'name_en': opening.name_en,
                     'description': opening.description,
@@ -816,9 +1212,13 @@ class BasicAnalyzer:
                     'evaluation_score': opening.evaluation_score,
                     'key_ideas': opening.key_ideas
                 }
+            if len(self._opening_memo) >= self._opening_memo_limit:
+                self._opening_memo.clear()
+            self._opening_memo[opening_moves] = info
+            return info
         except Exception:
             pass
-        
+
         return None
     
     def _check_missed_win(
@@ -837,7 +1237,11 @@ class BasicAnalyzer:
         2. If player had VCF but played elsewhere → check if defensive move was needed
         3. If actual move creates FIVE → NOT a mistake (player won!)
         4. If opponent had VCF/OPEN_FOUR and player blocked it → NOT a mistake (good defense!)
-        
+
+        Not safe to run concurrently across moves: the VCF searcher works
+        on (and can mutate) the shared board, and each analyze_game
+        iteration observes the state the previous checks left behind.
+
         Args:
             board: Board state before the move
             player: Player who made the move
@@ -850,13 +1254,42 @@ class BasicAnalyzer:
             return None
         
         try:
-            opponent = "O" if player == "X" else "X"
-            
+            opponent = _OPPONENT[player]
+            
+            # Hash the incoming position before any VCF search runs: the
+            # searcher works on (and on success pollutes) the shared
+            # board, so hashes and threat results must be taken first.
+            stones_hash = self._zobrist.compute_hash(board, 'X')
+            after_hash = stones_hash ^ self._zobrist.get_hash_key(
+                actual_move.x, actual_move.y, player
+            )
+
             # FIRST: Check if the actual move creates FIVE or OPEN_FOUR (winning move)
             # If so, this is NOT a mistake - player won or will win!
-            board_after = [row[:] for row in board]
-            board_after[actual_move.x][actual_move.y] = player
-            threats_after = self.threat_detector.detect_all_threats(board_after, player)
+            player_threats_before = self._detect_threats_hashed(
+                board, player, stones_hash
+            )
+            opp_threats_before = self._detect_threats_hashed(
+                board, opponent, stones_hash
+            )
+            # Place the actual move in place and take both after-move
+            # threat results while the board is still clean; they are
+            # memoized under after_hash, so the later checks below never
+            # need an after-board of their own
+            board[actual_move.x][actual_move.y] = player
+            try:
+                threats_after = self._detect_threats_hashed(
+                    board, player, after_hash,
+                    pre_result=player_threats_before,
+                    delta_move=(actual_move.x, actual_move.y)
+                )
+                opp_threats_after = self._detect_threats_hashed(
+                    board, opponent, after_hash,
+                    pre_result=opp_threats_before,
+                    delta_move=(actual_move.x, actual_move.y)
+                )
+            finally:
+                board[actual_move.x][actual_move.y] = None
             if threats_after.threats.get(ThreatType.FIVE, 0) > 0:
                 # Player won with this move - definitely not a mistake!
                 return None
@@ -864,20 +1297,24 @@ class BasicAnalyzer:
                 # Player created OPEN_FOUR - this is a winning move!
                 # OPEN_FOUR guarantees win on next move
                 return None
-            
+
             # SECOND: Check if opponent had immediate threat that needed blocking
-            opp_threats_before = self.threat_detector.detect_all_threats(board, opponent)
             opp_had_open_four = opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0) > 0
             opp_had_four = opp_threats_before.threats.get(ThreatType.FOUR, 0) > 0
             opp_had_vcf = False
-            
+            opp_vcf = None
+
             if not opp_had_open_four:
-                opp_vcf = self._vcf_searcher.search(board, opponent)
+                # The searcher can leave the winning line's stones behind
+                # when it finds a VCF, so snapshot the after-move position
+                # now - it is only needed for the after-move VCF re-search
+                board_after = [row[:] for row in board]
+                board_after[actual_move.x][actual_move.y] = player
+                opp_vcf = self._search_vcf_hashed(board, opponent, stones_hash)
                 opp_had_vcf = opp_vcf.found
-            
+
             # If opponent had immediate threat, check if player blocked it
             if opp_had_open_four or opp_had_vcf:
-                opp_threats_after = self.threat_detector.detect_all_threats(board_after, opponent)
                 opp_open_four_before = opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0)
                 opp_open_four_after = opp_threats_after.threats.get(ThreatType.OPEN_FOUR, 0)
                 
@@ -900,17 +1337,20 @@ class BasicAnalyzer:
                             'best_move': best_block
                         }
                 
-                # Check if opponent's VCF is still valid after our move
-                opp_vcf_after = self._vcf_searcher.search(board_after, opponent)
-                
-                if opp_had_vcf and not opp_vcf_after.found:
-                    # Successfully blocked opponent's VCF - not a mistake
-                    return None
-                
-                # If opponent had VCF and we blocked their first move, it's good defense
+                # Check if opponent's VCF is still valid after our move.
+                # The after-search only matters when the opponent actually
+                # had a VCF, so skip it on the pure OPEN_FOUR path
                 if opp_had_vcf:
-                    opp_vcf = self._vcf_searcher.search(board, opponent)
-                    if opp_vcf.found and opp_vcf.sequence:
+                    opp_vcf_after = self._search_vcf_hashed(
+                        board_after, opponent, after_hash
+                    )
+                    if not opp_vcf_after.found:
+                        # Successfully blocked opponent's VCF - not a mistake
+                        return None
+
+                    # If we blocked the VCF's first move, it's good defense;
+                    # opp_vcf was already searched above, reuse it
+                    if opp_vcf.sequence:
                         first_opp_vcf = opp_vcf.sequence[0]
                         # Check if our move blocks opponent's VCF first move
                         if actual_move.x == first_opp_vcf[0] and actual_move.y == first_opp_vcf[1]:
@@ -920,14 +1360,15 @@ class BasicAnalyzer:
             # Blocking OPEN_THREE is a valid defensive move, even if player had VCF
             opp_open_three_before = opp_threats_before.threats.get(ThreatType.OPEN_THREE, 0)
             if opp_open_three_before > 0:
-                opp_threats_after = self.threat_detector.detect_all_threats(board_after, opponent)
                 opp_open_three_after = opp_threats_after.threats.get(ThreatType.OPEN_THREE, 0)
                 if opp_open_three_after < opp_open_three_before:
                     # Successfully blocked OPEN_THREE - this is valid defense
                     # Not a mistake even if player had VCF
                     return None
             
-            # FOURTH: Check if player had VCF before making this move
+            # FOURTH: Check if player had VCF before making this move.
+            # Not memoized: the opponent search above may have left stones
+            # on the board, so stones_hash no longer describes its content
             vcf_result = self._vcf_searcher.search(board, player)
             
             if vcf_result.found and vcf_result.sequence:
@@ -937,15 +1378,11 @@ class BasicAnalyzer:
                     first_vcf_move[1] != actual_move.y):
                     # Player missed the winning move!
                     # But only if opponent didn't have a faster VCF
+                    # (reuse the searches from the SECOND step: opp_vcf is
+                    # the before-move search and, when it found a win, the
+                    # after-move search already came back positive above)
                     if opp_had_vcf:
-                        opp_vcf = self._vcf_searcher.search(board, opponent)
-                        if opp_vcf.found and opp_vcf.depth <= vcf_result.depth:
-                            # Opponent's VCF is faster or equal - player needed to defend
-                            # Check if player's move actually blocked opponent's VCF
-                            opp_vcf_after = self._vcf_searcher.search(board_after, opponent)
-                            if not opp_vcf_after.found:
-                                # Successfully blocked - not a mistake
-                                return None
+                        if opp_vcf.depth <= vcf_result.depth:
                             # Player didn't block opponent's VCF - this is a mistake!
                             # Return the defensive move as best_move
                             if opp_vcf.sequence:
@@ -976,31 +1413,67 @@ class BasicAnalyzer:
         opponent: str
     ) -> Optional[Tuple[int, int]]:
         """Find the position to block opponent's OPEN_FOUR."""
-        # Try all empty positions and find one that blocks the OPEN_FOUR
-        for x in range(BOARD_SIZE):
-            for y in range(BOARD_SIZE):
-                if board[x][y] is None:
-                    # Try placing our piece here
-                    test_board = [row[:] for row in board]
-                    player = "O" if opponent == "X" else "X"
-                    test_board[x][y] = player
-                    threats_after = self.threat_detector.detect_all_threats(test_board, opponent)
-                    if threats_after.threats.get(ThreatType.OPEN_FOUR, 0) == 0:
-                        return (x, y)
+        player = _OPPONENT[opponent]
+        stones_hash = self._zobrist.compute_hash(board, 'X')
+        pre_threats = self._detect_threats_hashed(board, opponent, stones_hash)
+
+        def blocks_open_four(x: int, y: int) -> bool:
+            """Place the stone in place and rescan just its lines."""
+            board[x][y] = player
+            try:
+                threats_after = self._detect_threats_hashed(
+                    board, opponent,
+                    stones_hash ^ self._zobrist.get_hash_key(x, y, player),
+                    pre_result=pre_threats,
+                    delta_move=(x, y)
+                )
+            finally:
+                board[x][y] = None
+            return threats_after.threats.get(ThreatType.OPEN_FOUR, 0) == 0
+
+        # The only candidates that can break an OPEN_FOUR are the two
+        # open ends of its line, so derive them from the detected threat
+        # positions instead of trying every empty square
+        for threat in pre_threats.threat_positions:
+            if threat.type != ThreatType.OPEN_FOUR:
+                continue
+            positions = sorted(threat.positions)
+            if len(positions) < 2:
+                continue
+            dx = positions[1][0] - positions[0][0]
+            dy = positions[1][1] - positions[0][1]
+            if dx != 0:
+                dx //= abs(dx)
+            if dy != 0:
+                dy //= abs(dy)
+            for x, y in (
+                (positions[0][0] - dx, positions[0][1] - dy),
+                (positions[-1][0] + dx, positions[-1][1] + dy),
+            ):
+                if (0 <= x < self.board_size and 0 <= y < self.board_size
+                        and board[x][y] is None and blocks_open_four(x, y)):
+                    return (x, y)
+
+        # Defensive fallback in case the threat positions did not yield a
+        # working block (e.g. overlapping threats). A cell that breaks an
+        # OPEN_FOUR always sits on one of its open ends, adjacent to an
+        # opponent stone, so only the empty neighbourhood of opponent
+        # stones needs trying — in row-major order, like the old full scan
+        neighbours = set()
+        for x, row in enumerate(board):
+            for y, cell in enumerate(row):
+                if cell == opponent:
+                    for dx in (-1, 0, 1):
+                        for dy in (-1, 0, 1):
+                            nx, ny = x + dx, y + dy
+                            if (0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE
+                                    and board[nx][ny] is None):
+                                neighbours.add((nx, ny))
+        for x, y in sorted(neighbours):
+            if blocks_open_four(x, y):
+                return (x, y)
         return None
     
-    def _board_with_move(
-        self,
-        board: List[List[Optional[str]]],
-        x: int,
-        y: int,
-        player: str
-    ) -> List[List[Optional[str]]]:
-        """Create a copy of the board with a move applied."""
-        new_board = [row[:] for row in board]
-        new_board[x][y] = player
-        return new_board
-    
     def _simplify_comments(self, multi_lang_comment: MultiLangComment) -> MultiLangComment:
         """
         Simplify comments for beginner players.
@@ -1014,45 +1487,18 @@ class BasicAnalyzer:
         Returns:
             Simplified MultiLangComment
         """
-        from .game_metadata import get_simple_term
-        
         # Get comments as dict
         comments = multi_lang_comment.to_dict()
         simplified = {}
-        
-        # Technical terms to simplify
-        term_mappings = {
-            "fork": "fork",
-            "Fork": "fork",
-            "FORK": "fork",
-            "đa đường": "fork",
-            "双杀": "fork",
-            "フォーク": "fork",
-            "tứ mở": "open_four",
-            "Tứ Mở": "open_four",
-            "活四": "open_four",
-            "四々": "open_four",
-            "open four": "open_four",
-            "Open Four": "open_four",
-            "tứ kín": "closed_four",
-            "Tứ Kín": "closed_four",
-            "冲四": "closed_four",
-            "四": "closed_four",
-            "tam mở": "open_three",
-            "Tam Mở": "open_three",
-            "活三": "open_three",
-            "三々": "open_three",
-        }
-        
+
         for lang, comment in comments.items():
-            simplified_comment = comment
-            # Replace technical terms with simple explanations
-            for term, key in term_mappings.items():
-                if term in simplified_comment:
-                    simple = get_simple_term(key, lang)
-                    simplified_comment = simplified_comment.replace(term, simple)
-            simplified[lang] = simplified_comment
-        
+            # One precompiled pass per comment; substituted text is not
+            # rescanned, so replacements can no longer compound
+            simplified[lang] = _SIMPLIFY_TERM_PATTERN.sub(
+                lambda m: _simple_term(_SIMPLIFY_TERM_KEYS[m.group(0).lower()], lang),
+                comment
+            )
+
         return MultiLangComment(**simplified)
     
     def _classify_move_with_context(
@@ -1075,22 +1521,13 @@ class BasicAnalyzer:
         """
         # Get rating from metadata handler (uses context-aware thresholds)
         rating = self._metadata_handler.get_rating_for_score(actual_score)
-        
-        # Map rating string to MoveClassification
-        rating_to_classification = {
-            "excellent": MoveClassification.EXCELLENT,
-            "good": MoveClassification.GOOD,
-            "average": MoveClassification.OKAY,
-            "poor": MoveClassification.WEAK,
-            "blunder": MoveClassification.BLUNDER
-        }
-        
+
         # Get base classification from rating
-        base_classification = rating_to_classification.get(rating, MoveClassification.OKAY)
-        
+        base_classification = _RATING_TO_CLASSIFICATION.get(rating, MoveClassification.OKAY)
+
         # Also consider score difference from best move
         score_diff = best_score - actual_score
-        
+
         # CRITICAL: If best move is a winning move (score >= 10000) and we didn't play it
         # This is a serious mistake - missed win opportunity
         if best_score >= 10000 and actual_score < 10000:
@@ -1099,29 +1536,13 @@ class BasicAnalyzer:
                 return MoveClassification.BLUNDER  # Missed clear win
             elif score_diff > 1000:
                 return MoveClassification.WEAK  # Missed good winning opportunity
-        
-        # If score difference is significant, may need to downgrade
-        if score_diff > 5000:
-            # Huge score loss - this is a blunder
-            return MoveClassification.BLUNDER
-        elif score_diff > 1000:
-            # Large score loss - this is weak
-            return MoveClassification.WEAK
-        elif score_diff > 200:
-            # Moderate score loss - downgrade appropriately
-            if base_classification == MoveClassification.EXCELLENT:
-                return MoveClassification.OKAY
-            elif base_classification == MoveClassification.GOOD:
-                return MoveClassification.WEAK
-        elif score_diff > 50:
-            # Small score loss - downgrade by one level
-            if base_classification == MoveClassification.EXCELLENT:
-                return MoveClassification.GOOD
-            elif base_classification == MoveClassification.GOOD:
-                return MoveClassification.OKAY
-            elif base_classification == MoveClassification.OKAY:
-                return MoveClassification.WEAK
-        
+
+        # Select the downgrade band for the score loss; bisect_left keeps
+        # the ladder's strict "greater than" boundaries
+        downgrades = _SCORE_DIFF_DOWNGRADES[bisect_left(_SCORE_DIFF_BANDS, score_diff)]
+        if downgrades is not None:
+            return downgrades.get(base_classification, base_classification)
+
         return base_classification
     
     def _generate_enhanced_note(
@@ -1190,7 +1611,14 @@ class BasicAnalyzer:
         Uses iterative deepening to progressively search deeper while
         respecting time constraints. Returns the best moves from the
         deepest completed search.
-        
+
+        Root candidates are scored sequentially on purpose. The minimax
+        below is pure Python, so threads would serialize on the GIL, and
+        every root call shares the board, stone list, neighbour counts,
+        killer/history tables and transposition table, all mutated via
+        make/unmake — parallel workers would need per-thread copies of
+        the lot, costing more than the sequential scan they replace.
+
         Args:
             board: Current board state
             player: Player to find moves for
@@ -1201,8 +1629,33 @@ class BasicAnalyzer:
         Returns:
             List of (x, y, score) tuples for best moves
         """
-        candidates = self._get_candidate_moves(board)
-        
+        # Serve repeat queries of the same position/side/depth from the
+        # per-analysis memo: callers differ only in how many moves they
+        # keep, so the full scored list is stored and sliced per call.
+        # Time-limited searches are not memoized — their results depend
+        # on how far the budget let them get.
+        memo_key = None
+        if time_limit_ms is None:
+            memo_key = (self._zobrist.compute_hash(board, 'X'), player, depth)
+            cached = self._best_moves_cache.get(memo_key)
+            if cached is not None:
+                return cached[:top_n]
+
+        # Sweep the board once for its stones; the search below keeps this
+        # list current on make/unmake so deeper nodes skip the sweep
+        self._search_stones = [
+            (x, y)
+            for x, row in enumerate(board)
+            for y, cell in enumerate(row)
+            if cell is not None
+        ]
+        self._neighbor_counts.fill(0)
+        for x, y in self._search_stones:
+            self._neighbor_counts[
+                max(0, x - 1):x + 2, max(0, y - 1):y + 2
+            ] += 1
+        candidates = self._get_candidate_moves(board, stones=self._search_stones)
+
         if not candidates:
             # If no candidates, return center or first empty cell
             center = self.board_size // 2
@@ -1215,18 +1668,20 @@ class BasicAnalyzer:
             return []
 
         # Early check for forced wins or must-block threats
-        opponent = "O" if player == "X" else "X"
+        opponent = _OPPONENT[player]
         winning_moves: List[Tuple[int, int, float]] = []
         blocking_moves: List[Tuple[int, int, float]] = []
 
-        opp_threats_before = self.threat_detector.detect_all_threats(board, opponent)
-        opp_five_before = opp_threats_before.threats.get(ThreatType.FIVE, 0)
-        opp_open_four_before = opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0)
-        opp_four_before = opp_threats_before.threats.get(ThreatType.FOUR, 0)
-        opp_open_three_before = opp_threats_before.threats.get(ThreatType.OPEN_THREE, 0)
-        opp_double_four_before = opp_threats_before.double_threats.get(DoubleThreatType.DOUBLE_FOUR, 0)
-        opp_four_three_before = opp_threats_before.double_threats.get(DoubleThreatType.FOUR_THREE, 0)
-        opp_double_three_before = opp_threats_before.double_threats.get(DoubleThreatType.DOUBLE_THREE, 0)
+        # Hash the root stones once so every per-candidate detection below
+        # goes through the Zobrist-keyed memo and a line-local delta rescan;
+        # repeat calls on the same position become dictionary lookups
+        base_hash = self._zobrist.compute_hash(board, 'X')
+        opp_threats_before = self._detect_threats_hashed(board, opponent, base_hash)
+        my_threats_before = self._detect_threats_hashed(board, player, base_hash)
+        before_counts = _block_counts(opp_threats_before)
+        (opp_five_before, opp_open_four_before, opp_four_before,
+         opp_open_three_before, opp_double_four_before,
+         opp_four_three_before, opp_double_three_before) = before_counts
 
         has_immediate_loss = (
             opp_five_before > 0
@@ -1238,16 +1693,26 @@ class BasicAnalyzer:
         # OPEN_THREE is also dangerous - opponent can create OPEN_FOUR next turn
         has_dangerous_threat = has_immediate_loss or opp_open_three_before > 0
 
+        # Blocked counts are clamped at zero, so with nothing to block the
+        # defensive evaluation below can never fire — skip it per candidate
+        opp_has_block_targets = any(before_counts)
+
         for x, y in candidates:
             # Try our move: if it creates forced win, return immediately
             board[x][y] = player
-            my_threats = self.threat_detector.detect_all_threats(board, player)
-            my_double_four = my_threats.double_threats.get(DoubleThreatType.DOUBLE_FOUR, 0)
-            my_four_three = my_threats.double_threats.get(DoubleThreatType.FOUR_THREE, 0)
+            move_hash = base_hash ^ self._zobrist.get_hash_key(x, y, player)
+            my_threats = self._detect_threats_hashed(
+                board, player, move_hash,
+                pre_result=my_threats_before, delta_move=(x, y)
+            )
+            my_tget = my_threats.threats.get
+            my_dget = my_threats.double_threats.get
+            my_double_four = my_dget(_D_DOUBLE_FOUR, 0)
+            my_four_three = my_dget(_D_FOUR_THREE, 0)
             if (
-                my_threats.threats.get(ThreatType.FIVE, 0) > 0
-                or my_threats.threats.get(ThreatType.OPEN_FOUR, 0) > 0
-                or my_threats.threats.get(ThreatType.FOUR, 0) > 0
+                my_tget(_T_FIVE, 0) > 0
+                or my_tget(_T_OPEN_FOUR, 0) > 0
+                or my_tget(_T_FOUR, 0) > 0
                 or my_double_four > 0
                 or my_four_three > 0
             ):
@@ -1255,17 +1720,25 @@ class BasicAnalyzer:
                 board[x][y] = None
                 continue
 
+            if not opp_has_block_targets:
+                board[x][y] = None
+                continue
+
             # Evaluate defensive value: does this move remove immediate threats?
-            opp_threats_after = self.threat_detector.detect_all_threats(board, opponent)
+            opp_threats_after = self._detect_threats_hashed(
+                board, opponent, move_hash,
+                pre_result=opp_threats_before, delta_move=(x, y)
+            )
             board[x][y] = None
 
-            blocked_five = max(0, opp_five_before - opp_threats_after.threats.get(ThreatType.FIVE, 0))
-            blocked_open_four = max(0, opp_open_four_before - opp_threats_after.threats.get(ThreatType.OPEN_FOUR, 0))
-            blocked_four = max(0, opp_four_before - opp_threats_after.threats.get(ThreatType.FOUR, 0))
-            blocked_open_three = max(0, opp_open_three_before - opp_threats_after.threats.get(ThreatType.OPEN_THREE, 0))
-            blocked_double_four = max(0, opp_double_four_before - opp_threats_after.double_threats.get(DoubleThreatType.DOUBLE_FOUR, 0))
-            blocked_four_three = max(0, opp_four_three_before - opp_threats_after.double_threats.get(DoubleThreatType.FOUR_THREE, 0))
-            blocked_double_three = max(0, opp_double_three_before - opp_threats_after.double_threats.get(DoubleThreatType.DOUBLE_THREE, 0))
+            # Diff the fixed-position count tuples instead of re-resolving
+            # each enum key against both result dicts per candidate
+            (blocked_five, blocked_open_four, blocked_four,
+             blocked_open_three, blocked_double_four,
+             blocked_four_three, blocked_double_three) = (
+                b - a if b > a else 0
+                for b, a in zip(before_counts, _block_counts(opp_threats_after))
+            )
 
             blocked_any = (
                 blocked_five
@@ -1287,21 +1760,46 @@ class BasicAnalyzer:
                 blocking_moves.append((x, y, block_score))
 
         if winning_moves:
-            return sorted(winning_moves, key=lambda m: m[2], reverse=True)[:top_n]
+            winning_moves.sort(key=lambda m: m[2], reverse=True)
+            self._store_best_moves(memo_key, winning_moves)
+            return winning_moves[:top_n]
         if blocking_moves:
-            return sorted(blocking_moves, key=lambda m: m[2], reverse=True)[:top_n]
+            blocking_moves.sort(key=lambda m: m[2], reverse=True)
+            self._store_best_moves(memo_key, blocking_moves)
+            return blocking_moves[:top_n]
         
         # Start new search in transposition table
         if self.use_tt and self._tt is not None:
             self._tt.new_search()
-        
+
+        # A five that predates the search can't run through any search
+        # move, so detect that case once here; per-node terminal tests
+        # then only scan the lines through the move just made
+        self._root_has_five = self._board_has_five(board)
+
+
         # Time management
         start_time = time.time()
         time_limit = time_limit_ms / 1000.0 if time_limit_ms else None
         
         # Iterative deepening: search at increasing depths
         best_moves: List[Tuple[int, int, float]] = []
-        
+        scored_moves: List[Tuple[int, int, float]] = []
+
+        # The root position is the same at every depth, so hash it once;
+        # child hashes are derived incrementally below
+        initial_hash = None
+        if self.use_tt and self._tt is not None:
+            initial_hash = self._tt.compute_hash(board, player)
+            # Search the best move remembered for this root first: with
+            # alpha-beta, starting from the previous best prunes the most
+            _, root_tt_move = self._tt.probe(
+                initial_hash, 0, NEG_INF, POS_INF
+            )
+            if root_tt_move is not None and root_tt_move in candidates:
+                candidates.remove(root_tt_move)
+                candidates.insert(0, root_tt_move)
+
         for current_depth in range(0, depth + 1, 2):  # 0, 2, 4, ...
             if current_depth == 0:
                 current_depth = 1  # Minimum depth 1
@@ -1313,12 +1811,7 @@ class BasicAnalyzer:
                     break
             
             scored_moves: List[Tuple[int, int, float]] = []
-            
-            # Compute initial hash for TT
-            initial_hash = None
-            if self.use_tt and self._tt is not None:
-                initial_hash = self._tt.compute_hash(board, player)
-            
+
             for x, y in candidates:
                 # Check time during search
                 if time_limit:
@@ -1328,30 +1821,54 @@ class BasicAnalyzer:
                 
                 # Make move and evaluate
                 board[x][y] = player
-                
+                self._push_search_stone(x, y)
+
                 # Update hash incrementally
                 new_hash = None
                 if initial_hash is not None and self._tt is not None:
                     new_hash = self._tt.update_hash(initial_hash, x, y, player)
                     new_hash = self._tt.toggle_side(new_hash)
-                
+
                 score = self._minimax(
-                    board, current_depth - 1, float('-inf'), float('inf'),
-                    False, player, new_hash
+                    board, current_depth - 1, NEG_INF, POS_INF,
+                    False, player, new_hash, (x, y)
                 )
-                
+
                 board[x][y] = None
+                self._pop_search_stone(x, y)
                 scored_moves.append((x, y, score))
             
             # Only update best_moves if we completed this depth
             if len(scored_moves) == len(candidates):
                 scored_moves.sort(key=lambda m: m[2], reverse=True)
                 best_moves = scored_moves[:top_n]
-                
+
                 # Reorder candidates for next iteration (best first)
                 candidates = [(x, y) for x, y, _ in scored_moves]
-        
-        return best_moves if best_moves else [(candidates[0][0], candidates[0][1], 0.0)]
+
+        if best_moves:
+            # scored_moves still holds the full sorted list of the last
+            # completed depth that best_moves was sliced from
+            self._store_best_moves(memo_key, scored_moves)
+            return best_moves
+        if scored_moves:
+            # The time budget interrupted the first depth: the moves that
+            # were scored still beat returning an unscored candidate
+            scored_moves.sort(key=lambda m: m[2], reverse=True)
+            return scored_moves[:top_n]
+        return [(candidates[0][0], candidates[0][1], 0.0)]
+
+    def _store_best_moves(
+        self,
+        memo_key: Optional[Tuple[int, str, int]],
+        scored: List[Tuple[int, int, float]]
+    ):
+        """Record a completed root search result, if memoizable."""
+        if memo_key is None:
+            return
+        if len(self._best_moves_cache) >= self._best_moves_cache_limit:
+            self._best_moves_cache.clear()
+        self._best_moves_cache[memo_key] = scored
 
     def _minimax(
         self,
@@ -1361,7 +1878,8 @@ class BasicAnalyzer:
         beta: float,
         is_maximizing: bool,
         original_player: str,
-        current_hash: int = None
+        current_hash: int = None,
+        last_move: Optional[Tuple[int, int]] = None
     ) -> float:
         """
         Minimax algorithm with alpha-beta pruning and transposition table.
@@ -1373,7 +1891,14 @@ class BasicAnalyzer:
         Optimizations:
         - Alpha-beta pruning: Cuts off branches that can't affect the result
         - Transposition table: Caches evaluated positions to avoid re-computation
-        
+
+        The recursion is kept deliberately: per-node time is dominated by
+        threat detection and candidate ordering, not call dispatch, and an
+        explicit frame stack would obscure the make/unmake pairing that
+        the incremental stone list and hash updates rely on. Depth is
+        bounded by the iterative-deepening caller, so stack depth is never
+        a concern.
+
         Args:
             board: Current board state (2D array)
             depth: Remaining search depth (0 = evaluate immediately)
@@ -1382,25 +1907,36 @@ class BasicAnalyzer:
             is_maximizing: True if it's the original player's turn
             original_player: The player we're finding moves for ("X" or "O")
             current_hash: Zobrist hash of current position (optional)
-            
+            last_move: Move that produced this position, if reached by
+                the search; lets the terminal test scan only the lines
+                through it
+
         Returns:
             Best achievable score from this position
         """
+        # Bind the table once per node: the recursion below touches it for
+        # the probe, per-candidate hash updates and the final store, and
+        # repeated self-attribute walks add up across the whole tree
+        tt = self._tt if self.use_tt else None
+
         # Compute hash if not provided and TT is enabled
-        if self.use_tt and self._tt is not None:
+        tt_move = None
+        if tt is not None:
             if current_hash is None:
                 current_player_for_hash = original_player if is_maximizing else (
-                    "O" if original_player == "X" else "X"
+                    _OPPONENT[original_player]
                 )
-                current_hash = self._tt.compute_hash(board, current_player_for_hash)
-            
-            # Probe transposition table
-            tt_score, tt_move = self._tt.probe(current_hash, depth, alpha, beta)
+                current_hash = tt.compute_hash(board, current_player_for_hash)
+
+            # Probe transposition table; probe returns the stored best
+            # move even when the entry's depth or bound can't cut, so
+            # one probe serves both the cutoff and move ordering below
+            tt_score, tt_move = tt.probe(current_hash, depth, alpha, beta)
             if tt_score is not None:
                 return tt_score
         
         # BASE CASE: Terminal state or depth limit reached
-        if depth == 0 or self._is_game_over(board):
+        if depth == 0 or self._is_game_over(board, last_move):
             # Use cached evaluation for performance (Task 35 - GAP 20)
             # Requirement 20.4: 5x-10x performance improvement
             eval_result = self._cached_evaluate_position(board, original_player)
@@ -1408,43 +1944,58 @@ class BasicAnalyzer:
         
         # Determine whose turn it is
         current_player = original_player if is_maximizing else (
-            "O" if original_player == "X" else "X"
+            _OPPONENT[original_player]
         )
         
-        # Get TT move for move ordering
-        tt_move = None
-        if self.use_tt and self._tt is not None and current_hash is not None:
-            _, tt_move = self._tt.probe(current_hash, 0, alpha, beta)
-        
-        # Get candidate moves with move ordering
+        # Get candidate moves with move ordering; the search-maintained
+        # stone list saves the per-node occupancy sweep
+        stones = self._search_stones
         candidates = self._get_candidate_moves(
-            board, limit=10, depth=depth, player=current_player, tt_move=tt_move
+            board, limit=10, depth=depth, player=current_player, tt_move=tt_move,
+            stones=stones
         )
         
         if not candidates:
             return 0.0  # No moves available, neutral score
-        
+
+        # Five-completing candidates found during ordering: their child
+        # nodes are terminal, so evaluate them in place below instead of
+        # recursing into a position the child would instantly score.
+        # Grab the reference now — recursion rebuilds the attribute.
+        five_moves = self._ordering_five_moves
+
         # Track best move for TT storage
         best_move = None
         original_alpha = alpha
         
         if is_maximizing:
-            max_eval = float('-inf')
+            max_eval = NEG_INF
             for x, y in candidates:
                 # Make the move temporarily
                 board[x][y] = current_player
-                
-                # Update hash incrementally if TT enabled
-                new_hash = None
-                if self.use_tt and self._tt is not None and current_hash is not None:
-                    new_hash = self._tt.update_hash(current_hash, x, y, current_player)
-                    new_hash = self._tt.toggle_side(new_hash)
-                
-                # Recursively evaluate
-                eval_score = self._minimax(
-                    board, depth - 1, alpha, beta, False, original_player, new_hash
-                )
-                
+
+                if (x, y) in five_moves:
+                    # Completed five: the child is terminal, take its
+                    # evaluation without the recursive call
+                    eval_score = self._cached_evaluate_position(
+                        board, original_player
+                    ).score
+                else:
+                    self._push_search_stone(x, y)
+
+                    # Update hash incrementally if TT enabled
+                    new_hash = None
+                    if tt is not None and current_hash is not None:
+                        new_hash = tt.update_hash(current_hash, x, y, current_player)
+                        new_hash = tt.toggle_side(new_hash)
+
+                    # Recursively evaluate
+                    eval_score = self._minimax(
+                        board, depth - 1, alpha, beta, False, original_player,
+                        new_hash, (x, y)
+                    )
+                    self._pop_search_stone(x, y)
+
                 # Undo the move
                 board[x][y] = None
                 
@@ -1460,31 +2011,40 @@ class BasicAnalyzer:
                     self._update_history((x, y), depth)
                     break  # Alpha-beta pruning
             
-            # Store in transposition table
-            if self.use_tt and self._tt is not None and current_hash is not None:
-                if max_eval <= original_alpha:
-                    entry_type = EntryType.UPPER
-                elif max_eval >= beta:
-                    entry_type = EntryType.LOWER
-                else:
-                    entry_type = EntryType.EXACT
-                self._tt.store(current_hash, depth, max_eval, entry_type, best_move)
-            
+            # Store in transposition table; original_alpha < beta, so the
+            # two bound flags are mutually exclusive and index straight
+            # into the ordered entry-type tuple
+            if tt is not None and current_hash is not None:
+                entry_type = _ENTRY_BY_ORDER[
+                    1 + (max_eval >= beta) - (max_eval <= original_alpha)
+                ]
+                tt.store(current_hash, depth, max_eval, entry_type, best_move)
+
             return max_eval
         else:
-            min_eval = float('inf')
+            min_eval = POS_INF
             for x, y in candidates:
                 board[x][y] = current_player
-                
-                new_hash = None
-                if self.use_tt and self._tt is not None and current_hash is not None:
-                    new_hash = self._tt.update_hash(current_hash, x, y, current_player)
-                    new_hash = self._tt.toggle_side(new_hash)
-                
-                eval_score = self._minimax(
-                    board, depth - 1, alpha, beta, True, original_player, new_hash
-                )
-                
+
+                if (x, y) in five_moves:
+                    # Completed five: terminal child, evaluate in place
+                    eval_score = self._cached_evaluate_position(
+                        board, original_player
+                    ).score
+                else:
+                    self._push_search_stone(x, y)
+
+                    new_hash = None
+                    if tt is not None and current_hash is not None:
+                        new_hash = tt.update_hash(current_hash, x, y, current_player)
+                        new_hash = tt.toggle_side(new_hash)
+
+                    eval_score = self._minimax(
+                        board, depth - 1, alpha, beta, True, original_player,
+                        new_hash, (x, y)
+                    )
+                    self._pop_search_stone(x, y)
+
                 board[x][y] = None
                 
                 if eval_score < min_eval:
@@ -1499,64 +2059,75 @@ class BasicAnalyzer:
                     self._update_history((x, y), depth)
                     break
             
-            # Store in transposition table
-            if self.use_tt and self._tt is not None and current_hash is not None:
-                if min_eval >= beta:
-                    entry_type = EntryType.LOWER
-                elif min_eval <= original_alpha:
-                    entry_type = EntryType.UPPER
-                else:
-                    entry_type = EntryType.EXACT
-                self._tt.store(current_hash, depth, min_eval, entry_type, best_move)
+            # Store in transposition table; beta has shrunk during the
+            # loop so both bounds can trip at once here — the fail-high
+            # flag keeps its original priority over fail-low
+            if tt is not None and current_hash is not None:
+                entry_type = _ENTRY_BY_ORDER[
+                    1 + (min_eval >= beta)
+                    - (min_eval < beta and min_eval <= original_alpha)
+                ]
+                tt.store(current_hash, depth, min_eval, entry_type, best_move)
             
             return min_eval
 
     
+    def _push_search_stone(self, x: int, y: int):
+        """Record a made search move in the stone list and neighbour counts."""
+        insort(self._search_stones, (x, y))
+        self._neighbor_counts[
+            max(0, x - 1):x + 2, max(0, y - 1):y + 2
+        ] += 1
+
+    def _pop_search_stone(self, x: int, y: int):
+        """Undo _push_search_stone for an unmade search move."""
+        self._search_stones.remove((x, y))
+        self._neighbor_counts[
+            max(0, x - 1):x + 2, max(0, y - 1):y + 2
+        ] -= 1
+
     def _get_candidate_moves(
         self,
         board: List[List[Optional[str]]],
         limit: int = 10,
         depth: int = 0,
         player: str = None,
-        tt_move: Tuple[int, int] = None
+        tt_move: Tuple[int, int] = None,
+        stones: Optional[List[Tuple[int, int]]] = None
     ) -> List[Tuple[int, int]]:
         """
         Get candidate moves with advanced move ordering.
-        
+
         Move ordering priority:
         1. TT best move (from transposition table)
         2. Threat moves (creating/blocking threats)
         3. Killer moves (caused cutoffs at this depth)
         4. History heuristic (frequently good moves)
         5. Position bonus (center > edge > corner)
-        
+
         Args:
             board: Current board state
             limit: Maximum number of candidates to return
             depth: Current search depth (for killer moves)
             player: Current player (for threat detection)
             tt_move: Best move from transposition table
-            
+            stones: Optional row-major sorted list of occupied cells;
+                when provided (the search maintains one incrementally),
+                the full-board occupancy sweep is skipped
+
         Returns:
             List of (x, y) candidate positions, ordered by priority
         """
-        candidates = set()
-        has_pieces = False
-        
-        for x in range(self.board_size):
-            for y in range(self.board_size):
-                if board[x][y] is not None:
-                    has_pieces = True
-                    # Add empty cells within 1 square
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            nx, ny = x + dx, y + dy
-                            if (0 <= nx < self.board_size and 
-                                0 <= ny < self.board_size and
-                                board[nx][ny] is None):
-                                candidates.add((nx, ny))
-        
-        if not has_pieces:
+        if stones is None:
+            stones = [
+                (x, y)
+                for x, row in enumerate(board)
+                for y, cell in enumerate(row)
+                if cell is not None
+            ]
+
+        if not stones:
+            # Empty board: answer before any candidate generation work
             center = self.board_size // 2
             if board[center][center] is None:
                 return [(center, center)]
@@ -1565,27 +2136,74 @@ class BasicAnalyzer:
                     if board[x][y] is None:
                         return [(x, y)]
             return []
-        
+
+        if stones is self._search_stones:
+            # The search maintains occupied-neighbour counts on
+            # make/unmake, so candidates fall out of one C-level scan
+            # instead of dilating every stone's 3x3 block per node
+            candidates = [
+                (int(x), int(y))
+                for x, y in np.argwhere(self._neighbor_counts > 0)
+                if board[x][y] is None
+            ]
+        else:
+            neighbour_set = set()
+            size = self.board_size
+            for x, y in stones:
+                # Add empty cells within 1 square
+                for dx, dy in _NEIGHBOR_OFFSETS:
+                    nx, ny = x + dx, y + dy
+                    if (0 <= nx < size and 0 <= ny < size and
+                            board[nx][ny] is None):
+                        neighbour_set.add((nx, ny))
+            # Row-major like the counts path, so move ordering breaks
+            # score ties identically on both paths
+            candidates = sorted(neighbour_set)
+
         # Score candidates with move ordering heuristics
         scored = []
-        killers = self._killer_moves.get(depth, [])
-        
+        killers = ()
+        if 0 <= depth < self._max_killer_depth:
+            killers = tuple(
+                (int(kx), int(ky))
+                for kx, ky in self._killer_moves[depth]
+                if kx >= 0
+            )
+        history = self._history_table
+
+        # Candidates whose placement completes a five, recorded for the
+        # caller: minimax turns those children into direct terminal
+        # evaluations instead of recursing into a won position
+        self._ordering_five_moves = five_moves = set()
+
+        # One baseline detection per call; each candidate then only
+        # rescans the four lines through its own square (delta path of
+        # _detect_threats_hashed) instead of the whole board
+        if player:
+            stones_hash = self._zobrist.compute_hash(board, 'X')
+            base_threats = self._detect_threats_hashed(board, player, stones_hash)
+            hash_key = self._zobrist.get_hash_key
+
         for x, y in candidates:
             score = 0.0
-            
+
             # 1. TT move gets highest priority
             if tt_move and (x, y) == tt_move:
                 score += 100000
-            
+
             # 2. Threat moves (quick evaluation)
             if player:
                 # Check if this move creates a threat
                 board[x][y] = player
-                threats = self.threat_detector.detect_all_threats(board, player)
+                threats = self._detect_threats_hashed(
+                    board, player, stones_hash ^ hash_key(x, y, player),
+                    pre_result=base_threats, delta_move=(x, y)
+                )
                 board[x][y] = None
-                
+
                 if threats.threats.get(ThreatType.FIVE, 0) > 0:
                     score += 50000  # Winning move
+                    five_moves.add((x, y))
                 elif threats.threats.get(ThreatType.OPEN_FOUR, 0) > 0:
                     score += 10000  # Creates open four
                 elif threats.threats.get(ThreatType.FOUR, 0) > 0:
@@ -1598,11 +2216,10 @@ class BasicAnalyzer:
                 score += 500
             
             # 4. History heuristic
-            history_score = self._history_table.get((x, y), 0)
-            score += history_score * 0.1
+            score += int(history[x, y]) * 0.1
             
             # 5. Position bonus
-            score += self.position_evaluator.position_bonus(x, y)
+            score += self._pos_bonus[x][y]
             
             scored.append((x, y, score))
         
@@ -1612,51 +2229,140 @@ class BasicAnalyzer:
     
     def _update_killer_move(self, depth: int, move: Tuple[int, int]):
         """Update killer moves for a depth after a beta cutoff."""
-        if depth not in self._killer_moves:
-            self._killer_moves[depth] = []
-        
+        if not (0 <= depth < self._max_killer_depth):
+            return
+
         killers = self._killer_moves[depth]
-        if move not in killers:
-            killers.insert(0, move)
-            if len(killers) > self._max_killers:
-                killers.pop()
-    
+        x, y = move
+        for slot in range(self._max_killers):
+            if killers[slot, 0] == x and killers[slot, 1] == y:
+                return  # Already recorded at this depth
+
+        # Shift the existing killers down and put the new one in front;
+        # the oldest slot falls off the end
+        killers[1:] = killers[:-1]
+        killers[0, 0] = x
+        killers[0, 1] = y
+
     def _update_history(self, move: Tuple[int, int], depth: int):
         """Update history heuristic score for a move."""
-        x, y = move
-        current = self._history_table.get((x, y), 0)
         # Increase score based on depth (deeper = more valuable)
-        self._history_table[(x, y)] = current + depth * depth
-    
+        self._history_table[move[0], move[1]] += depth * depth
+
     def _clear_search_heuristics(self):
         """Clear killer moves and history table for new search."""
-        self._killer_moves.clear()
+        self._killer_moves.fill(-1)
         # Don't clear history completely - it's useful across searches
         # But decay old values
-        for key in self._history_table:
-            self._history_table[key] = self._history_table[key] // 2
+        self._history_table //= 2
     
-    def _is_game_over(self, board: List[List[Optional[str]]]) -> bool:
+    def _is_game_over(
+        self,
+        board: List[List[Optional[str]]],
+        last_move: Optional[Tuple[int, int]] = None
+    ) -> bool:
         """
         Check if the game is over (someone won or board is full).
-        
+
+        When the position was reached by a search move, only the lines
+        through that move can hold a new five (earlier fives would have
+        terminated the search at the node that created them, and a five
+        already on the root board is flagged in _root_has_five), so the
+        two full-board threat detections collapse to a four-line scan.
+
         Args:
             board: Current board state
-            
+            last_move: Search move that produced this position, if any
+
         Returns:
             True if game is over
         """
-        # Check for winner
-        for player in ["X", "O"]:
-            threats = self.threat_detector.detect_all_threats(board, player)
-            if threats.threats.get(ThreatType.FIVE, 0) > 0:
+        if last_move is not None:
+            if self._root_has_five or self._has_five_through(board, *last_move):
                 return True
-        
+            # The search keeps the stone list current, so board-full
+            # is a length comparison instead of a row sweep
+            return len(self._search_stones) == self.board_size * self.board_size
+
+        # Check for winner: one pass over the board covers both players,
+        # since only a completed run of five matters here — the full
+        # threat classification the detector performs is wasted work
+        if self._board_has_five(board):
+            return True
+
         # Check for full board
         for row in board:
             if None in row:
                 return False
         return True
+
+    def _board_has_five(self, board: List[List[Optional[str]]]) -> bool:
+        """
+        Check whether either player has five-in-a-row, in a single board
+        pass. Runs are only counted from their first stone (the
+        predecessor along the direction differs), so each line is walked
+        once regardless of who owns the stones.
+        """
+        size = self.board_size
+        for x in range(size):
+            row = board[x]
+            for y in range(size):
+                piece = row[y]
+                if piece is None:
+                    continue
+                # Horizontal
+                if y == 0 or row[y - 1] != piece:
+                    n = 1
+                    while y + n < size and row[y + n] == piece:
+                        n += 1
+                    if n >= 5:
+                        return True
+                # Vertical
+                if x == 0 or board[x - 1][y] != piece:
+                    n = 1
+                    while x + n < size and board[x + n][y] == piece:
+                        n += 1
+                    if n >= 5:
+                        return True
+                # Diagonal down (top-left to bottom-right)
+                if x == 0 or y == 0 or board[x - 1][y - 1] != piece:
+                    n = 1
+                    while x + n < size and y + n < size and board[x + n][y + n] == piece:
+                        n += 1
+                    if n >= 5:
+                        return True
+                # Diagonal up (bottom-left to top-right)
+                if x == 0 or y == size - 1 or board[x - 1][y + 1] != piece:
+                    n = 1
+                    while x + n < size and y - n >= 0 and board[x + n][y - n] == piece:
+                        n += 1
+                    if n >= 5:
+                        return True
+        return False
+
+    def _has_five_through(
+        self, board: List[List[Optional[str]]], x: int, y: int
+    ) -> bool:
+        """Check whether (x, y) is part of five-in-a-row on any line."""
+        piece = board[x][y]
+        if piece is None:
+            return False
+        size = self.board_size
+        for dx, dy in ((1, 0), (0, 1), (1, 1), (1, -1)):
+            count = 1
+            nx, ny = x + dx, y + dy
+            while 0 <= nx < size and 0 <= ny < size and board[nx][ny] == piece:
+                count += 1
+                nx += dx
+                ny += dy
+            nx, ny = x - dx, y - dy
+            while 0 <= nx < size and 0 <= ny < size and board[nx][ny] == piece:
+                count += 1
+                nx -= dx
+                ny -= dy
+            if count >= 5:
+                return True
+        return False
     
     def detect_patterns(
         self,
@@ -1688,7 +2394,7 @@ class BasicAnalyzer:
         """
         patterns: List[Pattern] = []
         # Replay the game move-by-move to analyze patterns at each position
-        board = [[None for _ in range(self.board_size)] for _ in range(self.board_size)]
+        board = [self._empty_row[:] for _ in range(self.board_size)]
         
         for i, move in enumerate(moves):
             move_number = i + 1
@@ -1699,35 +2405,48 @@ class BasicAnalyzer:
             
             # Analyze threats created by this move
             threats = self.threat_detector.detect_all_threats(board, player)
-            
+
+            # One pass over the threat positions feeds every attacking
+            # pattern branch below: the direction bitmask, the
+            # per-direction grouping and the type tallies, instead of
+            # re-iterating the list once per pattern
+            dir_mask = 0
+            threat_by_dir = ([], [], [], [])
+            open_three_count = 0
+            has_four = False
+            has_three = False
+            for t in threats.threat_positions:
+                dir_idx = _DIR_IDX[t.direction]
+                dir_mask |= 1 << dir_idx
+                threat_by_dir[dir_idx].append(t)
+                t_type = t.type
+                if t_type == ThreatType.OPEN_THREE:
+                    open_three_count += 1
+                    has_three = True
+                elif t_type == ThreatType.THREE:
+                    has_three = True
+                elif t_type == ThreatType.FOUR or t_type == ThreatType.OPEN_FOUR:
+                    has_four = True
+
             # ============================================
             # PATTERN: Tứ Hướng (Multi-directional threats)
             # ============================================
             # A player has threats coming from 3+ different directions,
             # making it nearly impossible for opponent to defend all of them
-            if len(threats.threat_positions) >= 4:
-                # Count unique directions (horizontal, vertical, diagonal_down, diagonal_up)
-                directions = set(t.direction for t in threats.threat_positions)
-                if len(directions) >= 3:
-                    patterns.append(Pattern(
-                        label=PATTERN_INFO["tu_huong"]["label"],
-                        explanation=PATTERN_INFO["tu_huong"]["explanation"],
-                        moves=[move_number],
-                        severity="high"
-                    ))
+            if len(threats.threat_positions) >= 4 and dir_mask.bit_count() >= 3:
+                patterns.append(Pattern(
+                    label=PATTERN_INFO["tu_huong"]["label"],
+                    explanation=PATTERN_INFO["tu_huong"]["explanation"],
+                    moves=[move_number],
+                    severity="high"
+                ))
             
             # ============================================
             # PATTERN: Song Song (Parallel attack lines)
             # ============================================
             # Two threats on parallel lines in the same direction
             # Opponent can only block one, guaranteeing the other succeeds
-            threat_by_dir = {}
-            for t in threats.threat_positions:
-                if t.direction not in threat_by_dir:
-                    threat_by_dir[t.direction] = []
-                threat_by_dir[t.direction].append(t)
-            
-            for direction, dir_threats in threat_by_dir.items():
+            for dir_threats in threat_by_dir:
                 if len(dir_threats) >= 2:
                     # Verify threats are on different parallel lines (not the same line)
                     if self._are_parallel_threats(dir_threats):
@@ -1744,9 +2463,7 @@ class BasicAnalyzer:
             # ============================================
             # Two open threes created simultaneously
             # Opponent can only block one, the other becomes open four next turn
-            open_threes = [t for t in threats.threat_positions 
-                         if t.type == ThreatType.OPEN_THREE]
-            if len(open_threes) >= 2:
+            if open_three_count >= 2:
                 patterns.append(Pattern(
                     label=PATTERN_INFO["double_three"]["label"],
                     explanation=PATTERN_INFO["double_three"]["explanation"],
@@ -1760,11 +2477,7 @@ class BasicAnalyzer:
             # A four (or open four) combined with a three (or open three)
             # This is a winning combination: opponent must block the four,
             # allowing the three to become a winning four next turn
-            fours = [t for t in threats.threat_positions 
-                    if t.type in [ThreatType.FOUR, ThreatType.OPEN_FOUR]]
-            threes = [t for t in threats.threat_positions 
-                     if t.type in [ThreatType.THREE, ThreatType.OPEN_THREE]]
-            if fours and threes:
+            if has_four and has_three:
                 patterns.append(Pattern(
                     label=PATTERN_INFO["four_three"]["label"],
                     explanation=PATTERN_INFO["four_three"]["explanation"],
@@ -1780,17 +2493,22 @@ class BasicAnalyzer:
             if i > 0 and move_number <= len(all_best_moves):
                 prev_best = all_best_moves[i - 1][1] if i > 0 else []
                 if prev_best:
-                    # Simulate: what if previous player played the best move instead?
+                    # Simulate in place: undo the current move, drop the
+                    # best move, and restore both cells afterwards
                     prev_player = moves[i - 1].player
-                    test_board = [row[:] for row in board]
-                    test_board[move.x][move.y] = None  # Undo current move
                     best_x, best_y, _ = prev_best[0]
-                    test_board[best_x][best_y] = prev_player
-                    
-                    # Check if that move would have won the game
-                    test_threats = self.threat_detector.detect_all_threats(
-                        test_board, prev_player
-                    )
+                    saved_move_cell = board[move.x][move.y]
+                    saved_best_cell = board[best_x][best_y]
+                    board[move.x][move.y] = None  # Undo current move
+                    board[best_x][best_y] = prev_player
+                    try:
+                        # Check if that move would have won the game
+                        test_threats = self.threat_detector.detect_all_threats(
+                            board, prev_player
+                        )
+                    finally:
+                        board[best_x][best_y] = saved_best_cell
+                        board[move.x][move.y] = saved_move_cell
                     if test_threats.threats.get(ThreatType.FIVE, 0) > 0:
                         # Previous player missed a winning move!
                         patterns.append(Pattern(
@@ -1806,26 +2524,37 @@ class BasicAnalyzer:
             # Opponent had an open four (guaranteed win) but player failed to block it
             # This is a critical defensive failure
             if i > 0:
-                opponent = "O" if player == "X" else "X"
-                # Check opponent's threats BEFORE this move
-                opp_threats_before = self.threat_detector.detect_all_threats(
-                    self._board_at_move(moves, i - 1), opponent
+                opponent = _OPPONENT[player]
+                # Opponent threats before this move: lift the stone off
+                # the replay board instead of rebuilding the position.
+                # Both this check and the defensive recognizer below
+                # consume the same before/after pair, so detect it once.
+                board[move.x][move.y] = None
+                try:
+                    opp_threats_before = self.threat_detector.detect_all_threats(
+                        board, opponent
+                    )
+                finally:
+                    board[move.x][move.y] = player
+                opp_had_open_four = (
+                    opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0) > 0
                 )
-                # If opponent had open four (must block or lose)
-                if opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0) > 0:
-                    # Check if this move successfully blocked it
+                opp_threats_after = None
+                if opp_had_open_four or self._defensive_recognizer:
                     opp_threats_after = self.threat_detector.detect_all_threats(
                         board, opponent
                     )
-                    # If open four still exists, player failed to block
-                    if opp_threats_after.threats.get(ThreatType.OPEN_FOUR, 0) > 0:
-                        patterns.append(Pattern(
-                            label=PATTERN_INFO["chan_muon"]["label"],
-                            explanation=PATTERN_INFO["chan_muon"]["explanation"],
-                            moves=[move_number],
-                            severity="major"
-                        ))
-            
+                # If opponent had open four (must block or lose) and it
+                # still exists after the move, player failed to block
+                if (opp_had_open_four and
+                        opp_threats_after.threats.get(ThreatType.OPEN_FOUR, 0) > 0):
+                    patterns.append(Pattern(
+                        label=PATTERN_INFO["chan_muon"]["label"],
+                        explanation=PATTERN_INFO["chan_muon"]["explanation"],
+                        moves=[move_number],
+                        severity="major"
+                    ))
+
             # ============================================
             # DEFENSIVE PATTERNS (Task 32 - GAP 12)
             # Requirements: 17.1, 17.2, 17.3, 17.4
@@ -1835,23 +2564,13 @@ class BasicAnalyzer:
             # - Chặn Hi Sinh (Sacrifice Block): sacrifices blocking for counter-attack
             # - Chặn Phòng Ngừa (Preventive Block): prevents opponent fork
             if i > 0 and self._defensive_recognizer:
-                opponent = "O" if player == "X" else "X"
-                board_before = self._board_at_move(moves, i - 1)
-                
-                # Get opponent threats before and after this move
-                opp_threats_before = self.threat_detector.detect_all_threats(
-                    board_before, opponent
-                )
-                opp_threats_after = self.threat_detector.detect_all_threats(
-                    board, opponent
-                )
-                
                 # Get player threats after this move (for counter-attack detection)
                 player_threats_after = self.threat_detector.detect_all_threats(
                     board, player
                 )
-                
-                # Detect defensive patterns
+
+                # Detect defensive patterns, reusing the opponent
+                # before/after detections from the late-block check
                 defensive_patterns = self._defensive_recognizer.detect_defensive_patterns(
                     board=board,
                     move=(move.x, move.y),
@@ -1906,18 +2625,6 @@ class BasicAnalyzer:
                 return True
         return False
     
-    def _board_at_move(
-        self,
-        moves: List[Move],
-        move_index: int
-    ) -> List[List[Optional[str]]]:
-        """Get board state at a specific move index."""
-        board = [[None for _ in range(self.board_size)] for _ in range(self.board_size)]
-        for i in range(move_index + 1):
-            if i < len(moves):
-                board[moves[i].x][moves[i].y] = moves[i].player
-        return board
-    
     def generate_note(
         self,
         move: Move,
@@ -1942,13 +2649,15 @@ class BasicAnalyzer:
         Returns:
             Vietnamese description string
         """
-        templates = NOTE_TEMPLATES.get(category, NOTE_TEMPLATES[MoveClassification.OKAY])
-        template = templates[0]  # Use first template for consistency
-        
+        templates = _NOTE_TEMPLATES_COMPILED.get(
+            category, _NOTE_TEMPLATES_COMPILED[MoveClassification.OKAY]
+        )
+        prefix, suffix = templates[0]  # Use first template for consistency
+
         # Generate reason based on threats and category (not score ratio)
         reason = self._generate_move_reason(move, eval_result, category)
-        
-        return template.format(reason=reason)
+
+        return prefix + reason + suffix
     
     def _generate_move_reason(
         self,
@@ -2027,12 +2736,21 @@ class BasicAnalyzer:
     ) -> str:
         """Generate Vietnamese reason for best move recommendation."""
         x, y, score = best_move
-        
-        # Simulate the move
+
+        # Simulate the move via the memo and a line-local rescan; the
+        # surrounding analysis usually computed these results already
+        stones_hash = self._zobrist.compute_hash(board, 'X')
+        move_hash = stones_hash ^ self._zobrist.get_hash_key(x, y, player)
+        threats_before = self._detect_threats_hashed(board, player, stones_hash)
         board[x][y] = player
-        threats = self.threat_detector.detect_all_threats(board, player)
-        board[x][y] = None
-        
+        try:
+            threats = self._detect_threats_hashed(
+                board, player, move_hash,
+                pre_result=threats_before, delta_move=(x, y)
+            )
+        finally:
+            board[x][y] = None
+
         if threats.threats.get(ThreatType.FIVE, 0) > 0:
             return "Nước thắng ngay lập tức!"
         
@@ -2046,9 +2764,9 @@ class BasicAnalyzer:
             return "Tạo ba mở, tạo áp lực lớn."
         
         # Check defensive value
-        opponent = "O" if player == "X" else "X"
-        opp_threats = self.threat_detector.detect_all_threats(board, opponent)
-        
+        opponent = _OPPONENT[player]
+        opp_threats = self._detect_threats_hashed(board, opponent, stones_hash)
+
         if opp_threats.threats.get(ThreatType.OPEN_FOUR, 0) > 0:
             return "Chặn tứ mở của đối thủ, tránh thua."
         
@@ -2065,74 +2783,49 @@ class BasicAnalyzer:
         
         return "Phát triển vị trí tốt nhất."
     
-    def _extract_threat_types(self, threats, player: str) -> List[ThreatType]:
-        """
-        Extract list of threat types created by a move.
-        
-        Task 6.3: Helper for comment generation
-        
-        Args:
-            threats: ThreatResult from threat detector
-            player: Player who made the move
-            
-        Returns:
-            List of ThreatType enums for threats created
-        """
-        threat_types = []
-        
-        # Check each threat type in priority order
-        if threats.threats.get(ThreatType.FIVE, 0) > 0:
-            threat_types.append(ThreatType.FIVE)
-        if threats.threats.get(ThreatType.OPEN_FOUR, 0) > 0:
-            threat_types.append(ThreatType.OPEN_FOUR)
-        if threats.threats.get(ThreatType.FOUR, 0) > 0:
-            threat_types.append(ThreatType.FOUR)
-        if threats.threats.get(ThreatType.BROKEN_FOUR, 0) > 0:
-            threat_types.append(ThreatType.BROKEN_FOUR)
-        if threats.threats.get(ThreatType.OPEN_THREE, 0) > 0:
-            threat_types.append(ThreatType.OPEN_THREE)
-        if threats.threats.get(ThreatType.THREE, 0) > 0:
-            threat_types.append(ThreatType.THREE)
-        if threats.threats.get(ThreatType.BROKEN_THREE, 0) > 0:
-            threat_types.append(ThreatType.BROKEN_THREE)
-        if threats.threats.get(ThreatType.OPEN_TWO, 0) > 0:
-            threat_types.append(ThreatType.OPEN_TWO)
-        
-        return threat_types
-    
-    def _detect_blocked_threats(self, threats_before, threats_after) -> List[ThreatType]:
+    def _diff_threats(
+        self,
+        player_threats_after,
+        opp_threats_before,
+        opp_threats_after
+    ) -> Tuple[List[ThreatType], List[ThreatType], bool, bool]:
         """
-        Detect which opponent threats were blocked by a move.
-        
-        Task 6.3: Helper for comment generation
-        
+        Derive created/blocked threats and winning/forced flags in one pass.
+
+        Task 6.3: Helper for comment generation. Fuses the previously
+        separate created-threat extraction, blocked-threat diff and the
+        winning/forced checks, all of which walk the same count dicts.
+
         Args:
-            threats_before: Opponent's ThreatResult before the move
-            threats_after: Opponent's ThreatResult after the move
-            
+            player_threats_after: Player's ThreatResult after the move
+            opp_threats_before: Opponent's ThreatResult before the move
+            opp_threats_after: Opponent's ThreatResult after the move
+
         Returns:
-            List of ThreatType enums for threats that were blocked
+            Tuple of (threats_created, threats_blocked, is_winning,
+            is_forced)
         """
-        blocked = []
-        
-        # Check each threat type - if count decreased, it was blocked
-        threat_types_to_check = [
-            ThreatType.OPEN_FOUR,
-            ThreatType.FOUR,
-            ThreatType.BROKEN_FOUR,
-            ThreatType.OPEN_THREE,
-            ThreatType.THREE,
-            ThreatType.BROKEN_THREE,
+        pt = player_threats_after.threats
+        ot_before = opp_threats_before.threats
+        ot_after = opp_threats_after.threats
+
+        # Threat types present after the move, in priority order
+        threats_created = [t for t in _CREATED_THREAT_TYPES if pt.get(t, 0) > 0]
+
+        # Opponent threat types whose count decreased - those were blocked
+        threats_blocked = [
+            t for t in _BLOCKED_THREAT_TYPES
+            if ot_before.get(t, 0) > ot_after.get(t, 0)
         ]
-        
-        for threat_type in threat_types_to_check:
-            before_count = threats_before.threats.get(threat_type, 0)
-            after_count = threats_after.threats.get(threat_type, 0)
-            if before_count > after_count:
-                blocked.append(threat_type)
-        
-        return blocked
-    
+
+        is_winning = pt.get(ThreatType.FIVE, 0) > 0
+        is_forced = (
+            ot_before.get(ThreatType.OPEN_FOUR, 0) > 0 or
+            ot_before.get(ThreatType.FOUR, 0) > 0
+        )
+
+        return threats_created, threats_blocked, is_winning, is_forced
+
     def generate_alternatives(
         self,
         board: List[List[Optional[str]]],
@@ -2281,11 +2974,20 @@ class BasicAnalyzer:
         Returns:
             Brief Vietnamese explanation
         """
-        # Simulate the move
+        # Simulate the move via the memo and a line-local rescan; the
+        # base-position results are shared across all alternatives
+        stones_hash = self._zobrist.compute_hash(board, 'X')
+        move_hash = stones_hash ^ self._zobrist.get_hash_key(x, y, player)
+        threats_before = self._detect_threats_hashed(board, player, stones_hash)
         board[x][y] = player
-        threats = self.threat_detector.detect_all_threats(board, player)
-        board[x][y] = None
-        
+        try:
+            threats = self._detect_threats_hashed(
+                board, player, move_hash,
+                pre_result=threats_before, delta_move=(x, y)
+            )
+        finally:
+            board[x][y] = None
+
         # Check offensive value
         if threats.threats.get(ThreatType.FIVE, 0) > 0:
             return "Thắng ngay!"
@@ -2311,13 +3013,18 @@ class BasicAnalyzer:
             return "Tạo ba mở, tạo áp lực."
         
         # Check defensive value
-        opponent = "O" if player == "X" else "X"
-        opp_threats_before = self.threat_detector.detect_all_threats(board, opponent)
-        
+        opponent = _OPPONENT[player]
+        opp_threats_before = self._detect_threats_hashed(board, opponent, stones_hash)
+
         board[x][y] = player
-        opp_threats_after = self.threat_detector.detect_all_threats(board, opponent)
-        board[x][y] = None
-        
+        try:
+            opp_threats_after = self._detect_threats_hashed(
+                board, opponent, move_hash,
+                pre_result=opp_threats_before, delta_move=(x, y)
+            )
+        finally:
+            board[x][y] = None
+
         # Check if blocks opponent threats
         opp_open_four_before = opp_threats_before.threats.get(ThreatType.OPEN_FOUR, 0)
         opp_open_four_after = opp_threats_after.threats.get(ThreatType.OPEN_FOUR, 0)
@@ -2384,14 +3091,17 @@ class BasicAnalyzer:
             Summary with stats and insights
         """
         total_moves = len(moves)
-        
-        # Determine winner
-        board = [[None for _ in range(self.board_size)] for _ in range(self.board_size)]
+
+        # Determine winner by replaying the stones on a flat bytearray:
+        # copying and indexing stay in C, and only the four lines through
+        # each placed stone are checked for a five
+        n = self.board_size
+        flat_board = bytearray(n * n)
         winner = None
         for move in moves:
-            board[move.x][move.y] = move.player
-            threats = self.threat_detector.detect_all_threats(board, move.player)
-            if threats.threats.get(ThreatType.FIVE, 0) > 0:
+            code = _PLAYER_CODE[move.player]
+            flat_board[move.x * n + move.y] = code
+            if _has_five(flat_board, n, move.x, move.y, code):
                 winner = move.player
                 break
         
@@ -2552,22 +3262,36 @@ class BasicAnalyzer:
         Returns:
             EvaluationResult from cache or fresh evaluation
         """
+        # Zobrist-keyed memo first: one XOR pass over the stones versus
+        # AnalysisCache's md5 of the stringified board per lookup
+        cache_key = (self._zobrist.compute_hash(board, 'X'), player)
+        cached = self._eval_result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Try cache first
         if self._cache is not None:
             cached = self._cache.get_position_evaluation(board, player)
             if cached is not None:
+                if len(self._eval_result_cache) >= self._eval_cache_limit:
+                    self._eval_result_cache.clear()
+                self._eval_result_cache[cache_key] = cached
                 return cached
-        
+
         # Compute fresh evaluation
         if self.use_advanced and self._advanced_evaluator:
             result = self._advanced_evaluator.evaluate_position(board, player)
         else:
             result = self.position_evaluator.evaluate_position(board, player)
-        
+
         # Store in cache
         if self._cache is not None:
             self._cache.set_position_evaluation(board, player, result)
-        
+
+        if len(self._eval_result_cache) >= self._eval_cache_limit:
+            self._eval_result_cache.clear()
+        self._eval_result_cache[cache_key] = result
+
         return result
     
     def _cached_detect_threats(
@@ -2587,21 +3311,115 @@ class BasicAnalyzer:
         Returns:
             ThreatResult from cache or fresh detection
         """
+        # The Zobrist-keyed threat memo answers repeats without the md5
+        # key AnalysisCache builds from the stringified board
+        cache_key = (self._zobrist.compute_hash(board, 'X'), player)
+        cached = self._threat_result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Try cache first
         if self._cache is not None:
             cached = self._cache.get_patterns(board, player)
             if cached is not None:
-                return cached
-        
-        # Compute fresh detection
-        result = self.threat_detector.detect_all_threats(board, player)
-        
-        # Store in cache
-        if self._cache is not None:
-            self._cache.set_patterns(board, player, result)
-        
+                result = cached
+            else:
+                result = self.threat_detector.detect_all_threats(board, player)
+                self._cache.set_patterns(board, player, result)
+        else:
+            result = self.threat_detector.detect_all_threats(board, player)
+
+        if len(self._threat_result_cache) >= self._threat_result_cache_limit:
+            self._threat_result_cache.clear()
+        self._threat_result_cache[cache_key] = result
+
         return result
-    
+
+    def _detect_threats_hashed(
+        self,
+        board: List[List[Optional[str]]],
+        player: str,
+        stones_hash: int,
+        pre_result=None,
+        delta_move: Optional[Tuple[int, int]] = None
+    ):
+        """
+        Detect threats keyed by the Zobrist hash of the stones on board.
+
+        The analyze_game loop asks for threat results on the same position
+        several times (pre-move, post-move, hypothetical placement), and
+        consecutive iterations revisit positions already scanned. Keying
+        by the Zobrist hash of the stones makes those lookups O(1) instead
+        of repeating a full-board scan.
+
+        When the position differs from an already-analyzed one by a single
+        stone, callers can pass that earlier result plus the stone's
+        position and a cache miss falls back to detect_threats_delta,
+        which only rescans the four lines through the stone.
+
+        Args:
+            board: Current board state
+            player: Player to detect threats for
+            stones_hash: Zobrist hash of the stones on board
+            pre_result: Optional ThreatResult for board minus one stone
+            delta_move: Position (x, y) of that stone, if pre_result given
+
+        Returns:
+            ThreatResult from cache, delta rescan, or fresh detection
+        """
+        cache_key = (stones_hash, player)
+        cached = self._threat_result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if pre_result is not None and delta_move is not None:
+            result = self.threat_detector.detect_threats_delta(
+                pre_result, board, delta_move[0], delta_move[1], player
+            )
+        else:
+            result = self.threat_detector.detect_all_threats(board, player)
+
+        if len(self._threat_result_cache) >= self._threat_result_cache_limit:
+            self._threat_result_cache.clear()
+        self._threat_result_cache[cache_key] = result
+
+        return result
+
+    def _search_vcf_hashed(
+        self,
+        board: List[List[Optional[str]]],
+        player: str,
+        stones_hash: int
+    ):
+        """
+        VCF search keyed by the Zobrist hash of the stones on board.
+
+        The missed-win check searches the position after the last move and
+        the best-move suggestion then searches the very same position, so
+        memoizing saves a full VCF search per analysis.
+
+        Only call this with a hash that matches the board's current
+        content: on success the searcher leaves the winning line on the
+        board, so sites that run after such a search must keep using
+        the searcher directly.
+
+        Args:
+            board: Current board state
+            player: Attacker to search the VCF for
+            stones_hash: Zobrist hash of the stones on board
+
+        Returns:
+            VCFResult from cache or a fresh search
+        """
+        cache_key = (stones_hash, player)
+        cached = self._vcf_result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._vcf_searcher.search(board, player)
+        self._vcf_result_cache[cache_key] = result
+        return result
+
     def _cached_evaluate_move(
         self,
         board: List[List[Optional[str]]],
@@ -2623,19 +3441,34 @@ class BasicAnalyzer:
         Returns:
             Move score from cache or fresh evaluation
         """
+        # Zobrist-keyed memo first, as in _cached_evaluate_position
+        cache_key = (
+            self._zobrist.compute_hash(board, 'X'), move_x, move_y, player
+        )
+        cached = self._move_eval_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Try cache first
         if self._cache is not None:
             cached = self._cache.get_move_evaluation(board, move_x, move_y, player)
             if cached is not None:
+                if len(self._move_eval_cache) >= self._eval_cache_limit:
+                    self._move_eval_cache.clear()
+                self._move_eval_cache[cache_key] = cached
                 return cached
-        
+
         # Compute fresh evaluation
         score = self.position_evaluator.evaluate_move(board, move_x, move_y, player)
-        
+
         # Store in cache
         if self._cache is not None:
             self._cache.set_move_evaluation(board, move_x, move_y, player, score)
-        
+
+        if len(self._move_eval_cache) >= self._eval_cache_limit:
+            self._move_eval_cache.clear()
+        self._move_eval_cache[cache_key] = score
+
         return score
     
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -2653,3 +3486,8 @@ class BasicAnalyzer:
         """Clear all caches."""
         if self._cache is not None:
             self._cache.clear_all()
+        self._threat_result_cache.clear()
+        self._vcf_result_cache.clear()
+        self._eval_result_cache.clear()
+        self._move_eval_cache.clear()
+        self._best_moves_cache.clear()
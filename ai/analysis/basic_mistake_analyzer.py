@@ -21,6 +21,7 @@ NOT included (reserved for Pro tier):
 - Deep strategic analysis
 """
 
+import random
 from typing import List, Tuple, Optional, Dict
 from dataclasses import dataclass
 from enum import Enum
@@ -137,6 +138,12 @@ class BasicMistakeAnalyzer:
             self._vcf_searcher = VCFSearch(board_size, max_depth=12)  # Depth 12 for Basic
         except ImportError:
             pass
+
+        # Tip rotation: one shuffled order per category, cycled by a
+        # cursor, instead of random.choice on every call. Same variety,
+        # no repeats within a cycle, no per-call RNG work.
+        self._tip_orders: Dict[BasicMistakeCategory, List[int]] = {}
+        self._tip_cursors: Dict[BasicMistakeCategory, int] = {}
     
     def analyze(
         self,
@@ -316,10 +323,17 @@ class BasicMistakeAnalyzer:
         return None
     
     def get_tip_for_category(self, category: BasicMistakeCategory) -> str:
-        """Get a random tip for a mistake category."""
-        import random
+        """Get a tip for a mistake category, cycling a shuffled order."""
         tips = BASIC_TIPS.get(category, ["Hãy suy nghĩ kỹ trước khi đi."])
-        return random.choice(tips)
+        order = self._tip_orders.get(category)
+        if order is None or len(order) != len(tips):
+            order = list(range(len(tips)))
+            random.shuffle(order)
+            self._tip_orders[category] = order
+            self._tip_cursors[category] = 0
+        cursor = self._tip_cursors[category]
+        self._tip_cursors[category] = cursor + 1
+        return tips[order[cursor % len(order)]]
     
     def get_category_label(self, category: BasicMistakeCategory) -> str:
         """Get Vietnamese label for category."""
@@ -13,7 +13,8 @@ Requirements: 4.1, 4.2, 4.3, 4.4, 4.5
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 
 from .types import (
@@ -250,6 +251,34 @@ COMMENT_TEMPLATES: Dict[str, Dict[str, str]] = {
 }
 
 
+# Blunder reasons by language (used by the "blunder" template)
+BLUNDER_REASONS: Dict[str, str] = {
+    "vi": "Không chặn đe dọa của đối thủ",
+    "en": "Failed to block opponent's threat",
+    "zh": "未能阻挡对手威胁",
+    "ja": "相手の脅威をブロックできなかった",
+}
+
+
+def _compile_template(text: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Pre-parse a template into (literal, field_name) segments.
+
+    Rendering then becomes plain string concatenation instead of
+    re-parsing the format spec on every call.
+    """
+    return tuple(
+        (literal, field)
+        for literal, field, _, _ in Formatter().parse(text)
+    )
+
+
+# Fork-defining threat types (two or more of these is a fork)
+_FORK_THREAT_TYPES = (
+    ThreatType.OPEN_FOUR, ThreatType.FOUR, ThreatType.BROKEN_FOUR
+)
+
+
 class CommentGenerator:
     """
     Generates move comments in multiple languages.
@@ -270,6 +299,15 @@ class CommentGenerator:
         self.templates = COMMENT_TEMPLATES
         self.threat_labels = THREAT_LABELS
         self.classification_labels = CLASSIFICATION_LABELS
+        # Templates pre-parsed into (literal, field) segments per language,
+        # so the per-move hot path does concatenation only
+        self._compiled: Dict[str, Dict[str, Tuple[Tuple[str, Optional[str]], ...]]] = {
+            key: {
+                lang: _compile_template(text)
+                for lang, text in langs.items()
+            }
+            for key, langs in COMMENT_TEMPLATES.items()
+        }
     
     def generate_comment(
         self,
@@ -300,62 +338,98 @@ class CommentGenerator:
         """
         if language not in SUPPORTED_LANGUAGES:
             language = "en"
-        
+
+        template_key, fields = self._select_template(
+            classification, threats_created, threats_blocked,
+            is_winning, is_forced, better_move
+        )
+        return self._render_compiled(template_key, language, fields)
+
+    def _select_template(
+        self,
+        classification: MoveClassification,
+        threats_created: List[ThreatType],
+        threats_blocked: List[ThreatType],
+        is_winning: bool,
+        is_forced: bool,
+        better_move: Optional[str]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Pick the template key and its field values for a move.
+
+        Field values are language-independent: ThreatType values are
+        resolved to localized labels at render time, so the selection
+        logic runs once even when rendering all languages.
+        """
         # Winning move
         if is_winning and ThreatType.FIVE in threats_created:
-            threat_label = self._get_threat_label(ThreatType.FIVE, language)
-            return self._format_template("winning_move", language, threat=threat_label)
-        
+            return "winning_move", {"threat": ThreatType.FIVE}
+
         # Forced response
         if is_forced and threats_blocked:
-            threat_label = self._get_threat_label(threats_blocked[0], language)
-            return self._format_template("forced", language, threat=threat_label)
-        
+            return "forced", {"threat": threats_blocked[0]}
+
         # Blunder with better alternative
         if classification == MoveClassification.BLUNDER and better_move:
             if threats_created:
-                threat_label = self._get_threat_label(threats_created[0], language)
-                return self._format_template(
-                    "missed_win", language,
-                    better_move=better_move, threat=threat_label
-                )
-            else:
-                reason = self._get_blunder_reason(threats_blocked, language)
-                return self._format_template("blunder", language, reason=reason)
-        
+                return "missed_win", {
+                    "better_move": better_move,
+                    "threat": threats_created[0],
+                }
+            return "blunder", {"reason": BLUNDER_REASONS}
+
         # Creates and blocks
         if threats_created and threats_blocked:
-            own_threat = self._get_threat_label(threats_created[0], language)
-            opp_threat = self._get_threat_label(threats_blocked[0], language)
-            return self._format_template(
-                "creates_and_blocks", language,
-                own_threat=own_threat, opp_threat=opp_threat
-            )
-        
+            return "creates_and_blocks", {
+                "own_threat": threats_created[0],
+                "opp_threat": threats_blocked[0],
+            }
+
         # Fork creation (multiple high-level threats)
-        high_threats = [t for t in threats_created if t in [
-            ThreatType.OPEN_FOUR, ThreatType.FOUR, ThreatType.BROKEN_FOUR
-        ]]
-        if len(high_threats) >= 2:
-            return self._format_template("fork", language)
-        
+        high_threats = sum(
+            1 for t in threats_created if t in _FORK_THREAT_TYPES
+        )
+        if high_threats >= 2:
+            return "fork", {}
+
         # Creates threat
         if threats_created:
-            threat_label = self._get_threat_label(threats_created[0], language)
-            return self._format_template("creates_threat", language, threat=threat_label)
-        
+            return "creates_threat", {"threat": threats_created[0]}
+
         # Blocks threat
         if threats_blocked:
-            threat_label = self._get_threat_label(threats_blocked[0], language)
-            return self._format_template("blocks_threat", language, threat=threat_label)
-        
+            return "blocks_threat", {"threat": threats_blocked[0]}
+
         # Developing or passive based on classification
-        if classification in [MoveClassification.EXCELLENT, MoveClassification.GOOD]:
-            return self._format_template("developing", language)
+        if classification in (MoveClassification.EXCELLENT, MoveClassification.GOOD):
+            return "developing", {}
         elif classification == MoveClassification.OKAY:
-            return self._format_template("center_control", language)
+            return "center_control", {}
         else:
-            return self._format_template("passive", language)
+            return "passive", {}
+
+    def _render_compiled(
+        self, template_key: str, language: str, fields: Dict[str, Any]
+    ) -> str:
+        """Render a pre-compiled template by concatenating its segments."""
+        by_lang = self._compiled.get(template_key)
+        if not by_lang:
+            return ""
+        segments = by_lang.get(language) or by_lang.get("en") or ()
+
+        parts = []
+        for literal, field in segments:
+            parts.append(literal)
+            if field is None:
+                continue
+            value = fields.get(field)
+            if isinstance(value, ThreatType):
+                parts.append(self._get_threat_label(value, language))
+            elif isinstance(value, dict):
+                parts.append(value.get(language, value["en"]))
+            elif value is not None:
+                parts.append(value)
+        return "".join(parts)
     
     def generate_all_languages(
         self,
@@ -384,23 +458,21 @@ class CommentGenerator:
             
         Requirement: 4.1
         """
+        # Select the template once; only rendering is per-language
+        template_key, fields = self._select_template(
+            classification, threats_created, threats_blocked,
+            is_winning, is_forced, better_move
+        )
+
         comments = {}
         for lang in SUPPORTED_LANGUAGES:
-            base_text = self.generate_comment(
-                classification=classification,
-                threats_created=threats_created,
-                threats_blocked=threats_blocked,
-                is_winning=is_winning,
-                is_forced=is_forced,
-                better_move=better_move,
-                language=lang
-            )
+            base_text = self._render_compiled(template_key, lang, fields)
             if use_cultural and scenario:
                 idiom = self.get_cultural_idiom(scenario, lang)
                 if idiom:
                     base_text = f"{base_text} {idiom}"
             comments[lang] = base_text
-        
+
         return MultiLangComment(**comments)
     
     def _get_threat_label(self, threat_type: ThreatType, language: str) -> str:
@@ -415,29 +487,11 @@ class CommentGenerator:
         labels = self.classification_labels.get(classification, {})
         return labels.get(language, labels.get("en", str(classification.value)))
     
-    def _format_template(
-        self, template_key: str, language: str, **kwargs
-    ) -> str:
-        """Format a template with the given parameters."""
-        template = self.templates.get(template_key, {})
-        text = template.get(language, template.get("en", ""))
-        
-        try:
-            return text.format(**kwargs)
-        except KeyError:
-            return text
-    
     def _get_blunder_reason(
         self, threats_blocked: List[ThreatType], language: str
     ) -> str:
         """Generate reason for blunder."""
-        reasons = {
-            "vi": "Không chặn đe dọa của đối thủ",
-            "en": "Failed to block opponent's threat",
-            "zh": "未能阻挡对手威胁",
-            "ja": "相手の脅威をブロックできなかった",
-        }
-        return reasons.get(language, reasons["en"])
+        return BLUNDER_REASONS.get(language, BLUNDER_REASONS["en"])
     
     def get_threat_label(self, threat_type: ThreatType, language: str = "vi") -> str:
         """
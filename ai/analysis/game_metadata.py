@@ -147,21 +147,24 @@ class GameMetadataHandler:
             metadata: Game metadata, defaults to casual game if not provided
         """
         self.metadata = metadata or GameMetadata()
-    
+        # Game type never changes after construction, so the multiplier
+        # is resolved once and reused by every score adjustment
+        self.strictness_multiplier = self.STRICTNESS_MULTIPLIERS.get(
+            self.metadata.game_type,
+            1.0
+        )
+
     def get_strictness_multiplier(self) -> float:
         """
         Get strictness multiplier based on game type.
-        
+
         Tournament games are evaluated more strictly (1.2x),
         casual games are more lenient (0.8x).
-        
+
         Returns:
             Strictness multiplier (0.8 to 1.2)
         """
-        return self.STRICTNESS_MULTIPLIERS.get(
-            self.metadata.game_type, 
-            1.0
-        )
+        return self.strictness_multiplier
     
     def get_comment_complexity(self, player: str = "X") -> CommentComplexity:
         """
@@ -224,13 +227,11 @@ class GameMetadataHandler:
         Returns:
             Adjusted score (same scale as input)
         """
-        multiplier = self.get_strictness_multiplier()
-        
         # Simply apply multiplier to the score
         # Tournament (1.2): slightly reduce non-winning scores
         # Casual (0.8): slightly increase scores
         # This preserves the relative differences between scores
-        return base_score * multiplier
+        return base_score * self.strictness_multiplier
     
     def get_rating_for_score(self, score: float) -> str:
         """
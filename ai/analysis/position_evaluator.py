@@ -16,6 +16,9 @@ from .types import (
 )
 from .threat_detector import ThreatDetector
 
+# Opponent color lookup, shared by every place that flips the side
+_OPPONENT = {"X": "O", "O": "X"}
+
 
 class PositionEvaluator:
     """Lightweight evaluator built on top of ThreatDetector."""
@@ -52,7 +55,7 @@ class PositionEvaluator:
     # ----------------------------
     def _aggregate_position_bonus(self, board: List[List[Optional[str]]], player: str) -> float:
         """Simple positional bonus: player's stones minus opponent's bonuses."""
-        opponent = "O" if player == "X" else "X"
+        opponent = _OPPONENT[player]
         player_bonus = 0.0
         opponent_bonus = 0.0
 
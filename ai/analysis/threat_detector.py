@@ -122,6 +122,108 @@ class ThreatDetector:
             double_threat_positions=double_threat_positions
         )
     
+    def detect_threats_delta(
+        self,
+        pre_result: ThreatResult,
+        board: List[List[Optional[str]]],
+        x: int,
+        y: int,
+        player: str
+    ) -> ThreatResult:
+        """
+        Recompute threats for a player after a single stone was placed.
+
+        A stone at (x, y) can only change threats on the four lines that
+        pass through it (row, column, and both diagonals). Threats from
+        pre_result on other lines are kept as-is and only those four lines
+        are rescanned, examining ~4*N cells instead of the full board.
+
+        Args:
+            pre_result: ThreatResult for `player` on the board before the stone
+            board: Board state with the stone already placed at (x, y)
+            x: Row index of the placed stone
+            y: Column index of the placed stone
+            player: The player to detect threats for ("X" or "O")
+
+        Returns:
+            ThreatResult equivalent to detect_all_threats(board, player)
+        """
+        threat_positions: List[ThreatPosition] = []
+        seen_positions: Set[Tuple[Tuple[int, int], ...]] = set()
+
+        # Keep threats that do not lie on a line through (x, y)
+        for threat in pre_result.threat_positions:
+            if self._threat_on_line_through(threat, x, y):
+                continue
+            pos_key = tuple(sorted(threat.positions))
+            if pos_key not in seen_positions:
+                seen_positions.add(pos_key)
+                threat_positions.append(threat)
+
+        # Rescan only the four lines through the placed stone
+        for direction_name, (dx, dy) in DIRECTIONS.items():
+            start_x, start_y = self._line_start_through(x, y, dx, dy)
+            line_threats = self.scan_line(
+                board, start_x, start_y, dx, dy, player
+            )
+            for threat in line_threats:
+                pos_key = tuple(sorted(threat.positions))
+                if pos_key not in seen_positions:
+                    seen_positions.add(pos_key)
+                    threat_positions.append(threat)
+
+        threats: dict = {t: 0 for t in ThreatType}
+        for threat in threat_positions:
+            threats[threat.type] += 1
+
+        total_score = sum(
+            count * THREAT_SCORES[threat_type]
+            for threat_type, count in threats.items()
+        )
+
+        # Double threats pair lines across directions, so recompute them
+        # from the combined threat list
+        double_threats, double_threat_positions = self.detect_double_threats(
+            board, player, threat_positions
+        )
+        total_score += sum(
+            count * DOUBLE_THREAT_SCORES[dt_type]
+            for dt_type, count in double_threats.items()
+        )
+
+        return ThreatResult(
+            threats=threats,
+            total_score=total_score,
+            threat_positions=threat_positions,
+            double_threats=double_threats,
+            double_threat_positions=double_threat_positions
+        )
+
+    def _threat_on_line_through(self, threat: ThreatPosition, x: int, y: int) -> bool:
+        """Check if a threat lies on its direction's line through (x, y)."""
+        if not threat.positions:
+            return True
+        px, py = threat.positions[0]
+        direction = threat.direction
+        if direction == "horizontal":
+            return px == x
+        if direction == "vertical":
+            return py == y
+        if direction == "diagonal_down":
+            return px - py == x - y
+        if direction == "diagonal_up":
+            return px + py == x + y
+        return True
+
+    def _line_start_through(
+        self, x: int, y: int, dx: int, dy: int
+    ) -> Tuple[int, int]:
+        """Walk backwards from (x, y) to the board edge along (dx, dy)."""
+        while 0 <= x - dx < self.board_size and 0 <= y - dy < self.board_size:
+            x -= dx
+            y -= dy
+        return x, y
+
     def detect_double_threats(
         self,
         board: List[List[Optional[str]]],
@@ -124,7 +124,7 @@ class Move:
     move_number: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreatPosition:
     """
     Represents a detected threat on the board.
@@ -139,7 +139,7 @@ class ThreatPosition:
     direction: str  # "horizontal", "vertical", "diagonal_down", "diagonal_up"
 
 
-@dataclass
+@dataclass(slots=True)
 class DoubleThreatPosition:
     """
     Represents a detected double threat on the board.
@@ -163,7 +163,7 @@ class DoubleThreatPosition:
     severity: str = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreatResult:
     """
     Result of threat detection for a player.
@@ -19,6 +19,9 @@ from dataclasses import dataclass
 from .types import ThreatType, BOARD_SIZE
 from .threat_detector import ThreatDetector
 
+# Opponent color lookup, shared by every place that flips the side
+_OPPONENT = {"X": "O", "O": "X"}
+
 
 @dataclass
 class VCFResult:
@@ -91,7 +94,7 @@ class VCFSearch:
             or found=False and empty sequence if no VCF
         """
         self._nodes_searched = 0
-        defender = "O" if attacker == "X" else "X"
+        defender = _OPPONENT[attacker]
         
         # CRITICAL FIX: Check if defender has immediate winning threat
         # If defender has FIVE or OPEN_FOUR, they win before attacker can play VCF
@@ -442,6 +442,45 @@ class TestThreatDetectorProperties:
             "Three in a row with open ends should be detected as OPEN_THREE"
 
 
+# ============================================
+# Property: Delta Detection Equivalence
+# ============================================
+
+class TestDeltaDetectionEquivalence:
+    """
+    Property: detect_threats_delta after placing one stone must produce
+    the same threat counts and scores as a full detect_all_threats rescan.
+    """
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = ThreatDetector()
+
+    @given(board_data=board_with_pieces(min_pieces=5, max_pieces=40),
+           x=st.integers(min_value=0, max_value=BOARD_SIZE - 1),
+           y=st.integers(min_value=0, max_value=BOARD_SIZE - 1),
+           placer=st.sampled_from(["X", "O"]),
+           player=st.sampled_from(["X", "O"]))
+    @settings(max_examples=30, deadline=None)
+    def test_delta_matches_full_rescan(self, board_data, x, y, placer, player):
+        """Delta detection must match a full rescan after one placement."""
+        board, _ = board_data
+        assume(board[x][y] is None)
+
+        pre_result = self.detector.detect_all_threats(board, player)
+        board[x][y] = placer
+
+        full = self.detector.detect_all_threats(board, player)
+        delta = self.detector.detect_threats_delta(pre_result, board, x, y, player)
+
+        assert delta.threats == full.threats, \
+            "Delta threat counts must match full rescan"
+        assert delta.total_score == full.total_score, \
+            "Delta total score must match full rescan"
+        assert delta.double_threats == full.double_threats, \
+            "Delta double-threat counts must match full rescan"
+
+
 # ============================================
 # Run tests if executed directly
 # ============================================